@@ -22,7 +22,7 @@ import aiohttp
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 # S3 integration
-from s3_utils.s3_client import S3Client
+from s3_utils.s3_client import AsyncS3Client, S3Client
 
 # Whisper and audio processing
 from faster_whisper import WhisperModel
@@ -115,6 +115,7 @@ class HealthResponse(BaseModel):
 app = FastAPI(title="ASR Service", version="1.0.0")
 whisper_model: Optional[WhisperModel] = None
 s3_client: Optional[S3Client] = None
+async_s3_client: Optional[AsyncS3Client] = None
 processing_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
 processing_jobs: Dict[str, Dict[str, Any]] = {}  # Store job status
 
@@ -129,9 +130,10 @@ app.add_middleware(
 
 def init_s3():
     """Initialize S3 client"""
-    global s3_client
+    global s3_client, async_s3_client
     try:
         s3_client = S3Client()
+        async_s3_client = AsyncS3Client(s3_client)
         logger.info("S3 client initialized", 
                    bucket=S3_BUCKET_NAME, 
                    endpoint=S3_ENDPOINT_URL)
@@ -264,8 +266,8 @@ async def transcribe_chunk_from_s3(s3_url: str, chunk_id: str, language: Optiona
         # Extract S3 key from URL
         s3_key = s3_url.split(f"{S3_BUCKET_NAME}/")[-1]
         
-        # Download file from S3
-        success = s3_client.download_file(s3_key, local_file_path)
+        # Download file from S3 (off the event loop)
+        success = await async_s3_client.download_file(s3_key, local_file_path)
         if not success:
             raise Exception(f"Failed to download file from S3: {s3_url}")
         
@@ -5,6 +5,7 @@ Provides unified S3 operations across all services
 
 from .s3_client import (
     S3Client,
+    AsyncS3Client,
     get_s3_client,
     upload_file,
     download_file,
@@ -15,6 +16,7 @@ from .s3_client import (
 
 __all__ = [
     'S3Client',
+    'AsyncS3Client',
     'get_s3_client', 
     'upload_file',
     'download_file',
@@ -6,7 +6,6 @@ Integrates with Redis queue system for job orchestration.
 """
 
 import asyncio
-import json
 import logging
 import os
 import shutil
@@ -20,6 +19,7 @@ from urllib.parse import urlparse
 
 import aiohttp
 import ffmpeg
+import orjson
 import redis.asyncio as redis
 import structlog
 import yt_dlp
@@ -55,6 +55,8 @@ logger = structlog.get_logger()
 
 # Configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://:redis_secure_password_2024@redis:6379")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
 ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:3001")
 STORAGE_PATH = Path(os.getenv("STORAGE_PATH", "./app/storage"))
 CHUNK_DURATION = int(os.getenv("CHUNK_DURATION", "300"))  # 5 minutes
@@ -140,7 +142,15 @@ class IngestService:
         """Initialize Redis connection"""
         global redis_client
         try:
-            redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+            # One shared pool for the whole process; keep idle connections
+            # alive across long downloads between event publishes.
+            redis_client = redis.from_url(
+                REDIS_URL,
+                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                socket_keepalive=True
+            )
             await redis_client.ping()
             logger.info("Redis connection established")
         except Exception as e:
@@ -156,7 +166,7 @@ class IngestService:
         event = {
             "eventId": str(uuid.uuid4()),
             "eventType": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),  # orjson emits the same ISO 8601 string
             "version": "1.0",
             "source": SERVICE_NAME,
             "correlationId": correlation_id or str(uuid.uuid4()),
@@ -164,7 +174,7 @@ class IngestService:
         }
 
         try:
-            await redis_client.publish("clipforge:events", json.dumps(event))
+            await redis_client.publish("clipforge:events", orjson.dumps(event))
             logger.info("Event published", event_type=event_type, correlation_id=correlation_id)
         except Exception as e:
             logger.error("Failed to publish event", event_type=event_type, error=str(e))
@@ -382,23 +392,27 @@ class IngestService:
                                      error=e.stderr.decode() if e.stderr else str(e))
                         thumbnail_path = None
 
-                    # Upload chunk to S3
+                    # Upload chunk (and its thumbnail, if generated successfully) to S3 concurrently
                     chunk_s3_key = f"chunks/{stream_metadata.stream_id}/{chunk_id}.mp4"
+                    uploads = [(str(chunk_path), chunk_s3_key)]
                     logger.info("Uploading chunk to S3", chunk_id=chunk_id, s3_key=chunk_s3_key)
-                    chunk_s3_url = self.s3_client.upload_file(str(chunk_path), chunk_s3_key)
-                    
-                    if not chunk_s3_url:
-                        logger.error("Failed to upload chunk to S3", chunk_id=chunk_id)
-                        continue  # Skip this chunk if upload fails
                     
-                    # Upload thumbnail to S3 if generated successfully
                     thumbnail_s3_url = None
                     thumbnail_s3_key = None
                     if thumbnail_path and thumbnail_path.exists():
                         thumbnail_s3_key = f"chunks/{stream_metadata.stream_id}/{chunk_id}_thumbnail.jpg"
+                        uploads.append((str(thumbnail_path), thumbnail_s3_key))
                         logger.info("Uploading chunk thumbnail to S3", chunk_id=chunk_id, s3_key=thumbnail_s3_key)
-                        thumbnail_s3_url = self.s3_client.upload_file(str(thumbnail_path), thumbnail_s3_key)
-                        
+                    
+                    upload_urls = self.s3_client.upload_files(uploads)
+                    chunk_s3_url = upload_urls[0]
+                    
+                    if not chunk_s3_url:
+                        logger.error("Failed to upload chunk to S3", chunk_id=chunk_id)
+                        continue  # Skip this chunk if upload fails
+                    
+                    if thumbnail_s3_key:
+                        thumbnail_s3_url = upload_urls[1]
                         if not thumbnail_s3_url:
                             logger.warning("Failed to upload chunk thumbnail to S3", chunk_id=chunk_id)
                     
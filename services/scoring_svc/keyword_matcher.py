@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Keyword matching helpers for transcription scoring
+"""
+
+from typing import Iterable, Set
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator, fall back to substring scans
+    ahocorasick = None
+
+class KeywordMatcher:
+    """Find which of a fixed set of keywords occur as substrings of a text.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, otherwise
+    one ``in`` scan per keyword. Both paths return the same set of keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self._automaton = None
+
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text: str) -> Set[str]:
+        """Return the keywords contained in text (callers pass lowercased text)"""
+        if not text:
+            return set()
+
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+
+        return {keyword for keyword in self.keywords if keyword in text}
@@ -5,27 +5,30 @@ Multi-modal highlight scoring service for orchestrator integration
 """
 
 import asyncio
-import json
+import gzip
+import heapq
 import os
-import uuid
-from datetime import datetime, timedelta
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-import logging
 
 import numpy as np
 import aiohttp
+import orjson
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 import structlog
+from cachetools import TTLCache
 
 # Import segment creation functions
 from segment_creators import (
     create_speech_based_segments, create_audio_peak_segments, 
     create_vision_event_segments, create_fusion_segments,
-    score_highlight_segment, calculate_segment_confidence,
+    score_highlight_segment, calculate_segment_confidence, build_event_index,
     get_segment_score_breakdown, get_segment_reasons,
-    remove_overlapping_segments
+    remove_overlapping_segments, finalize_segments
 )
 
 # Configure structured logging
@@ -39,7 +42,8 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        # orjson does the serialization in C; structlog expects a str back
+        structlog.processors.JSONRenderer(serializer=lambda obj, **kw: orjson.dumps(obj, **kw).decode())
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -55,6 +59,13 @@ ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:3001")
 HIGHLIGHT_THRESHOLD = float(os.getenv("HIGHLIGHT_THRESHOLD", "0.3"))
 MIN_HIGHLIGHT_DURATION = float(os.getenv("MIN_HIGHLIGHT_DURATION", "5.0"))
 MAX_HIGHLIGHT_DURATION = float(os.getenv("MAX_HIGHLIGHT_DURATION", "60.0"))
+MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_SCORING_JOBS", "4"))
+HIGHLIGHT_TOP_K = int(os.getenv("HIGHLIGHT_TOP_K", "0"))  # 0 keeps every highlight
+ACCESS_LOG = os.getenv("ACCESS_LOG", "false").lower() == "true"  # orchestrator polls /highlights often
+SCORING_WORKERS = int(os.getenv("SCORING_WORKERS", str(os.cpu_count() or 1)))
+WEBHOOK_GZIP_MIN_BYTES = int(os.getenv("WEBHOOK_GZIP_MIN_BYTES", "4096"))
+JOB_CACHE_MAXSIZE = int(os.getenv("JOB_CACHE_MAXSIZE", "10000"))
+JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", "3600"))  # seconds
 
 # Pydantic models
 class ChunkData(BaseModel):
@@ -78,9 +89,46 @@ class HealthResponse(BaseModel):
     service: str = "scoring_svc"
     version: str = "1.0.0"
 
+# Shared HTTP session for orchestrator webhooks (opened in lifespan)
+http_session: Optional[aiohttp.ClientSession] = None
+# Worker processes for CPU-bound scoring so the event loop stays responsive
+process_pool: Optional[ProcessPoolExecutor] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global http_session, process_pool
+    # Startup: one pooled session so webhooks reuse keep-alive connections
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+    process_pool = ProcessPoolExecutor(max_workers=SCORING_WORKERS)
+    
+    yield
+    
+    # Shutdown
+    await http_session.close()
+    http_session = None
+    process_pool.shutdown(wait=False, cancel_futures=True)
+    process_pool = None
+
 # FastAPI app and job tracking
-app = FastAPI(title="ClipForge Scoring Service", version="1.0.0")
-processing_jobs: Dict[str, Dict[str, Any]] = {}
+app = FastAPI(
+    title="ClipForge Scoring Service",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # highlight payloads can be large
+)
+processing_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+# Queued and running jobs stay here until they finish, so they can't be evicted mid-run
+active_jobs: Dict[str, Dict[str, Any]] = {}
+# Bounded so finished jobs (and their highlights) don't accumulate for the process lifetime
+finished_jobs: TTLCache = TTLCache(maxsize=JOB_CACHE_MAXSIZE, ttl=JOB_CACHE_TTL)
+
+def get_job(stream_id: str) -> Optional[Dict[str, Any]]:
+    """Look a job up among active jobs, then finished ones"""
+    job = active_jobs.get(stream_id)
+    return job if job is not None else finished_jobs.get(stream_id)
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -89,6 +137,16 @@ async def health_check():
         timestamp=datetime.utcnow().isoformat()
     )
 
+@app.get("/jobs/metrics")
+async def jobs_metrics():
+    """Job table occupancy (only finished jobs are bounded and expire)"""
+    return {
+        "active_jobs": len(active_jobs),
+        "finished_jobs": len(finished_jobs),
+        "max_finished_jobs": finished_jobs.maxsize,
+        "ttl_seconds": finished_jobs.ttl
+    }
+
 @app.post("/score-batch")
 async def score_batch_endpoint(
     request: ScoringRequest,
@@ -102,7 +160,7 @@ async def score_batch_endpoint(
         background_tasks.add_task(process_scoring_job, request)
         
         # Initialize job tracking
-        processing_jobs[stream_id] = {
+        active_jobs[stream_id] = {
             "status": "accepted",
             "accepted_at": datetime.utcnow().isoformat()
         }
@@ -117,75 +175,137 @@ async def score_batch_endpoint(
 @app.get("/highlights/{stream_id}")
 async def get_highlights(stream_id: str):
     """Get highlights for stream (polling endpoint for orchestrator)"""
-    if stream_id not in processing_jobs:
+    job = get_job(stream_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Stream not found")
     
-    return processing_jobs[stream_id]
+    return job
 
 
 async def process_scoring_job(request: ScoringRequest):
     """Background task to process scoring"""
     stream_id = request.streamId
+    job = active_jobs.setdefault(stream_id, {"status": "accepted"})
+    log = logger.bind(stream_id=stream_id)
     
-    try:
-        print(f"🎯 SCORING: Starting job for stream {stream_id}")
-        print(f"🎯 SCORING: Received {len(request.chunks)} chunks")
+    async with processing_semaphore:
+        try:
+            log.info("Scoring job started", chunk_count=len(request.chunks))
         
-        # Update status
-        processing_jobs[stream_id]["status"] = "processing"
-        processing_jobs[stream_id]["started_at"] = datetime.utcnow().isoformat()
+            # Update status
+            job["status"] = "processing"
+            job["started_at"] = datetime.utcnow().isoformat()
         
-        # Analyze chunks and generate highlights
-        highlights = await analyze_and_score_chunks(request.chunks)
+            # Analyze chunks and generate highlights, split across the worker pool
+            # Plain dicts pickle cheaper than Pydantic models across the process boundary
+            chunks_payload = [chunk.model_dump() for chunk in request.chunks]
+            max_chunk_end_time = get_max_chunk_end_time(request.chunks)
+            batch_size = max(1, -(-len(chunks_payload) // SCORING_WORKERS))
+            loop = asyncio.get_running_loop()
+            batch_results = await asyncio.gather(*[
+                loop.run_in_executor(process_pool, score_chunks_payload,
+                                     chunks_payload[i:i + batch_size], max_chunk_end_time)
+                for i in range(0, len(chunks_payload), batch_size)
+            ])
+            highlights = rank_highlights([h for batch in batch_results for h in batch])
         
-        print(f"🎯 SCORING: Generated {len(highlights)} highlights for stream {stream_id}")
+            log.info("Highlights generated", highlight_count=len(highlights))
         
-        # Update with results
-        processing_jobs[stream_id].update({
-            "status": "completed",
-            "completed_at": datetime.utcnow().isoformat(),
-            "highlights": highlights
-        })
+            # Update with results
+            job.update({
+                "status": "completed",
+                "completed_at": datetime.utcnow().isoformat(),
+                "highlights": highlights
+            })
         
-        # Notify orchestrator via webhook
-        await notify_orchestrator_webhook(stream_id, highlights)
+            # Notify orchestrator via webhook
+            await notify_orchestrator_webhook(stream_id, highlights)
         
-    except Exception as e:
-        print(f"🎯 SCORING ERROR: {e}")
-        logger.error("Scoring job failed", stream_id=stream_id, error=str(e))
-        processing_jobs[stream_id].update({
-            "status": "failed", 
-            "error": str(e),
-            "failed_at": datetime.utcnow().isoformat()
-        })
-
-async def analyze_and_score_chunks(chunks: List[ChunkInput]) -> List[Dict[str, Any]]:
-    """Core scoring logic with content-aware highlight detection"""
+        except Exception as e:
+            log.error("Scoring job failed", error=str(e), exc_info=True)
+            job.update({
+                "status": "failed", 
+                "error": str(e),
+                "failed_at": datetime.utcnow().isoformat()
+            })
+        finally:
+            # Only finished jobs are subject to the cache's size and TTL limits; leave a
+            # resubmission of the same stream that was accepted meanwhile in place
+            if active_jobs.get(stream_id) is job:
+                del active_jobs[stream_id]
+            finished_jobs[stream_id] = job
+
+def score_chunks_payload(chunks_payload: List[Dict[str, Any]],
+                         max_chunk_end_time: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Process pool entry point: rebuild chunk models from dicts and score them"""
+    return analyze_and_score_chunks(
+        [ChunkInput.model_validate(chunk) for chunk in chunks_payload], max_chunk_end_time
+    )
+
+def get_max_chunk_end_time(chunks: List[ChunkInput]) -> float:
+    """Latest chunk end time, used as the upper bound for the video duration"""
+    max_chunk_end_time = 0
+    for chunk in chunks:
+        chunk_end_time = chunk.chunkData.startTime + chunk.chunkData.duration
+        max_chunk_end_time = max(max_chunk_end_time, chunk_end_time)
+    return max_chunk_end_time
+
+def rank_highlights(highlights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order highlights by score, keeping only the best HIGHLIGHT_TOP_K when a limit is set"""
+    # Partial selection, no full sort
+    if 0 < HIGHLIGHT_TOP_K < len(highlights):
+        return heapq.nlargest(HIGHLIGHT_TOP_K, highlights, key=lambda x: x["score"])
+    
+    # Sort by score descending
+    highlights.sort(key=lambda x: x["score"], reverse=True)
+    return highlights
+
+def analyze_and_score_chunks(chunks: List[ChunkInput],
+                             max_chunk_end_time: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Core scoring logic with content-aware highlight detection
+    
+    max_chunk_end_time is passed when chunks are one batch of a larger stream.
+    """
     highlights = []
     
-    print(f"🎯 ANALYZE: Processing {len(chunks)} chunks with threshold {HIGHLIGHT_THRESHOLD}")
+    logger.info("Analyzing chunks", chunk_count=len(chunks), threshold=HIGHLIGHT_THRESHOLD)
     
     # Calculate the maximum reasonable duration based on the chunks provided
     # Use the latest chunk end time as the upper bound
-    max_chunk_end_time = 0
-    for chunk in chunks:
-        chunk_end_time = chunk.chunkData.startTime + chunk.chunkData.duration
-        max_chunk_end_time = max(max_chunk_end_time, chunk_end_time)
+    if max_chunk_end_time is None:
+        max_chunk_end_time = get_max_chunk_end_time(chunks)
     
     # Add a small buffer (10%) to the max time to account for slight variations
     estimated_video_duration = max_chunk_end_time * 1.1
-    print(f"🎯 ANALYZE: Estimated video duration based on chunks: {estimated_video_duration:.1f}s (max chunk end: {max_chunk_end_time:.1f}s)")
+    logger.info("Estimated video duration from chunks",
+                estimated_video_duration=estimated_video_duration,
+                max_chunk_end_time=max_chunk_end_time)
     
     for i, chunk in enumerate(chunks):
-        print(f"🎯 CHUNK {i+1}: ID={chunk.chunkId}")
-        print(f"🎯 CHUNK {i+1}: Has transcription: {bool(chunk.chunkData.transcription)}")
-        print(f"🎯 CHUNK {i+1}: Has vision: {bool(chunk.chunkData.vision)}")
-        print(f"🎯 CHUNK {i+1}: Has audio: {bool(chunk.chunkData.audioFeatures)}")
+        # Per-chunk detail is debug-only; filter_by_level drops it before any formatting
+        logger.debug("Analyzing chunk",
+                     chunk_index=i + 1,
+                     chunk_id=chunk.chunkId,
+                     has_transcription=bool(chunk.chunkData.transcription),
+                     has_vision=bool(chunk.chunkData.vision),
+                     has_audio=bool(chunk.chunkData.audioFeatures))
+        
+        # Chunks with no analysis data (idle menus, dead air) can't produce segments
+        if not (chunk.chunkData.transcription or chunk.chunkData.vision or chunk.chunkData.audioFeatures):
+            logger.debug("No analysis data, skipping chunk", chunk_id=chunk.chunkId)
+            continue
+        
+        # Parse the transcription once: segments feed the search, text length goes in metadata
+        transcription_text, transcription_segments = parse_transcription(chunk.chunkData.transcription)
         
         # Find optimal highlight segments within this chunk
-        highlight_segments = await find_highlight_segments_in_chunk(chunk)
+        highlight_segments = find_highlight_segments_in_chunk(chunk, transcription_segments)
+        
+        logger.debug("Potential segments found", chunk_id=chunk.chunkId, segment_count=len(highlight_segments))
         
-        print(f"🎯 CHUNK {i+1}: Found {len(highlight_segments)} potential segments")
+        # Per-chunk metadata, computed once and only if a segment qualifies
+        transcription_length = None
+        face_detected = False
         
         # Add qualifying segments to highlights
         for segment in highlight_segments:
@@ -193,25 +313,38 @@ async def analyze_and_score_chunks(chunks: List[ChunkInput]) -> List[Dict[str, A
                 # Calculate absolute start time
                 absolute_start_time = chunk.chunkData.startTime + segment["startTime"]
                 
-                print(f"🎯 SEGMENT: ✅ HIGHLIGHT! Score={segment['score']:.3f}, Duration={segment['duration']:.1f}s")
-                print(f"🎯 SEGMENT: Absolute start time: {absolute_start_time:.1f}s (chunk: {chunk.chunkData.startTime:.1f}s + segment: {segment['startTime']:.1f}s)")
+                logger.debug("Segment above threshold",
+                             chunk_id=chunk.chunkId,
+                             score=segment["score"],
+                             duration=segment["duration"],
+                             absolute_start_time=absolute_start_time)
                 
                 # Validate that absolute start time is within estimated video duration
                 if absolute_start_time >= estimated_video_duration:
-                    print(f"🎯 SEGMENT: ⚠️  Absolute start time {absolute_start_time:.1f}s exceeds estimated video duration ({estimated_video_duration:.1f}s)")
-                    print(f"🎯 SEGMENT: ❌ Skipping segment to avoid render errors")
+                    logger.debug("Segment starts past estimated video duration, skipping",
+                                 chunk_id=chunk.chunkId,
+                                 absolute_start_time=absolute_start_time,
+                                 estimated_video_duration=estimated_video_duration)
                     continue
                 
                 if absolute_start_time + segment["duration"] >= estimated_video_duration:
                     # Adjust duration to fit within video bounds
                     adjusted_duration = estimated_video_duration - absolute_start_time - 1  # Leave 1 second buffer
                     if adjusted_duration <= 5:  # If adjusted duration is too short, skip
-                        print(f"🎯 SEGMENT: ❌ Adjusted duration would be too short ({adjusted_duration:.1f}s), skipping")
+                        logger.debug("Adjusted segment too short, skipping",
+                                     chunk_id=chunk.chunkId, adjusted_duration=adjusted_duration)
                         continue
                     
-                    print(f"🎯 SEGMENT: ⚠️  Adjusting duration from {segment['duration']:.1f}s to {adjusted_duration:.1f}s to fit video bounds")
+                    logger.debug("Trimming segment to video bounds",
+                                 chunk_id=chunk.chunkId,
+                                 duration=segment["duration"],
+                                 adjusted_duration=adjusted_duration)
                     segment["duration"] = adjusted_duration
                 
+                if transcription_length is None:
+                    transcription_length = len(transcription_text) if chunk.chunkData.transcription else 0
+                    face_detected = chunk.chunkData.vision.get("faces_detected", False) if chunk.chunkData.vision else False
+                
                 highlights.append({
                     "chunkId": chunk.chunkId,
                     "score": segment["score"],
@@ -226,28 +359,28 @@ async def analyze_and_score_chunks(chunks: List[ChunkInput]) -> List[Dict[str, A
                     "reasons": segment["reasons"],
                     "metadata": {
                         "chunk_duration": chunk.chunkData.duration,
-                        "transcription_length": len(extract_transcription_text(chunk.chunkData.transcription)) if chunk.chunkData.transcription else 0,
-                        "face_detected": chunk.chunkData.vision.get("faces_detected", False) if chunk.chunkData.vision else False
+                        "transcription_length": transcription_length,
+                        "face_detected": face_detected
                     }
                 })
             else:
-                print(f"🎯 SEGMENT: ❌ Below threshold, score={segment['score']:.3f}")
+                logger.debug("Segment below threshold", chunk_id=chunk.chunkId, score=segment["score"])
     
-    print(f"🎯 ANALYZE: Found {len(highlights)} highlights from {len(chunks)} chunks")
+    logger.info("Highlights found", highlight_count=len(highlights), chunk_count=len(chunks))
     
-    # Sort by score descending
-    highlights.sort(key=lambda x: x["score"], reverse=True)
-    return highlights
+    return rank_highlights(highlights)
 
-async def find_highlight_segments_in_chunk(chunk: ChunkInput) -> List[Dict[str, Any]]:
+def find_highlight_segments_in_chunk(chunk: ChunkInput,
+                                     transcription_segments: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
     """Find optimal highlight segments within a chunk using content analysis"""
     segments = []
     duration = chunk.chunkData.duration
     
-    print(f"🎯 SEGMENT_ANALYSIS: Analyzing chunk {chunk.chunkId} (duration: {duration}s)")
+    logger.debug("Segment analysis started", chunk_id=chunk.chunkId, duration=duration)
     
     # Extract all available data
-    transcription_segments = extract_transcription_segments(chunk.chunkData.transcription)
+    if transcription_segments is None:
+        transcription_segments = extract_transcription_segments(chunk.chunkData.transcription)
     audio_peaks = analyze_audio_peaks(chunk.chunkData.audioFeatures, duration)
     vision_events = analyze_vision_events(chunk.chunkData.vision, duration)
     
@@ -266,12 +399,13 @@ async def find_highlight_segments_in_chunk(chunk: ChunkInput) -> List[Dict[str,
     # Approach 4: Multi-modal fusion segments (combine all data)
     candidates.extend(create_fusion_segments(transcription_segments, audio_peaks, vision_events, duration))
     
-    print(f"🎯 SEGMENT_ANALYSIS: Generated {len(candidates)} candidate segments")
+    logger.debug("Candidate segments generated", chunk_id=chunk.chunkId, candidate_count=len(candidates))
     
-    # Score and filter candidates
+    # Score and filter candidates (overlap index built once per chunk)
+    event_index = build_event_index(transcription_segments, audio_peaks, vision_events)
     for candidate in candidates:
         candidate["score"] = score_highlight_segment(
-            candidate, chunk, transcription_segments, audio_peaks, vision_events
+            candidate, chunk, transcription_segments, audio_peaks, vision_events, event_index
         )
         candidate["confidence"] = calculate_segment_confidence(candidate, chunk)
         candidate["breakdown"] = get_segment_score_breakdown(candidate, chunk)
@@ -286,9 +420,9 @@ async def find_highlight_segments_in_chunk(chunk: ChunkInput) -> List[Dict[str,
     ]
     
     # Remove overlapping segments, keeping highest scored
-    final_segments = remove_overlapping_segments(valid_candidates)
+    final_segments = finalize_segments(remove_overlapping_segments(valid_candidates))
     
-    print(f"🎯 SEGMENT_ANALYSIS: Selected {len(final_segments)} final segments")
+    logger.debug("Final segments selected", chunk_id=chunk.chunkId, segment_count=len(final_segments))
     
     return final_segments
 
@@ -344,6 +478,44 @@ def extract_transcription_segments(transcription: Optional[Dict[str, Any]]) -> L
     
     return segments
 
+def parse_transcription(transcription: Optional[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+    """Extract text and timed segments from transcription data in one pass over its segments
+    
+    Same results as extract_transcription_text and extract_transcription_segments.
+    """
+    if not transcription or not isinstance(transcription, dict):
+        return extract_transcription_text(transcription), []
+    
+    text = transcription.get("text", "")
+    text_parts = []
+    segments = []
+    
+    whisper_segments = transcription.get("segments")
+    if whisper_segments and isinstance(whisper_segments, list):
+        for seg in whisper_segments:
+            if not isinstance(seg, dict):
+                continue
+            if not text and seg.get("text"):
+                text_parts.append(seg["text"].strip())
+            if all(k in seg for k in ["start", "end", "text"]):
+                segments.append({
+                    "start": seg["start"],
+                    "end": seg["end"],
+                    "duration": seg["end"] - seg["start"],
+                    "text": seg["text"].strip(),
+                    "confidence": seg.get("confidence", 1.0)
+                })
+        
+        # If no text field, build it from segments (Whisper format)
+        if not text:
+            text = " ".join(text_parts)
+    
+    # Fallback: try getting from 'transcript' field
+    if not text and transcription.get("transcript"):
+        text = transcription["transcript"]
+    
+    return text, segments
+
 def analyze_audio_peaks(audio_features: Optional[Dict[str, Any]], duration: float) -> List[Dict[str, Any]]:
     """Analyze audio data to find energy peaks and interesting moments"""
     peaks = []
@@ -356,15 +528,13 @@ def analyze_audio_peaks(audio_features: Optional[Dict[str, Any]], duration: floa
         energy_data = audio_features["energy"]
         if isinstance(energy_data, list) and len(energy_data) > 0:
             # Find peaks in energy data
-            energy_peaks = find_peaks_in_signal(energy_data, duration)
-            peaks.extend([{**peak, "type": "energy"} for peak in energy_peaks])
+            peaks.extend(find_peaks_in_signal(energy_data, duration, peak_type="energy"))
     
     # Volume-based peaks
     if audio_features.get("volume"):
         volume_data = audio_features["volume"]
         if isinstance(volume_data, list) and len(volume_data) > 0:
-            volume_peaks = find_peaks_in_signal(volume_data, duration)
-            peaks.extend([{**peak, "type": "volume"} for peak in volume_peaks])
+            peaks.extend(find_peaks_in_signal(volume_data, duration, peak_type="volume"))
     
     # Spectral features (if available)
     if audio_features.get("spectral_features"):
@@ -401,8 +571,7 @@ def analyze_vision_events(vision_data: Optional[Dict[str, Any]], duration: float
     if vision_data.get("motion_intensity"):
         motion = vision_data["motion_intensity"]
         if isinstance(motion, list):
-            motion_events = find_peaks_in_signal(motion, duration, threshold=0.6)
-            events.extend([{**event, "type": "motion"} for event in motion_events])
+            events.extend(find_peaks_in_signal(motion, duration, threshold=0.6, peak_type="motion"))
     
     # Face detection events
     if vision_data.get("face_tracking"):
@@ -419,8 +588,9 @@ def analyze_vision_events(vision_data: Optional[Dict[str, Any]], duration: float
     
     return events
 
-def find_peaks_in_signal(signal_data: List[float], duration: float, threshold: float = 0.7) -> List[Dict[str, Any]]:
-    """Find peaks in a signal array"""
+def find_peaks_in_signal(signal_data: List[float], duration: float, threshold: float = 0.7,
+                         peak_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Find peaks in a signal array, tagging each with peak_type when given"""
     peaks = []
     
     if not signal_data or len(signal_data) < 3:
@@ -429,25 +599,26 @@ def find_peaks_in_signal(signal_data: List[float], duration: float, threshold: f
     # Calculate time step
     time_step = duration / len(signal_data)
     
-    # Find local maxima above threshold
-    for i in range(1, len(signal_data) - 1):
-        current = signal_data[i]
-        prev_val = signal_data[i-1]
-        next_val = signal_data[i+1]
+    # Find local maxima above threshold (vectorized neighbour comparison)
+    signal = np.asarray(signal_data, dtype=np.float64)
+    current = signal[1:-1]
+    is_peak = (current > signal[:-2]) & (current > signal[2:]) & (current > threshold)
+    
+    for i in (np.flatnonzero(is_peak) + 1).tolist():
+        peak_time = i * time_step
+        # Create a segment around the peak
+        segment_start = max(0, peak_time - 5)  # 5 seconds before
+        segment_end = min(duration, peak_time + 10)  # 10 seconds after
         
-        # Check if it's a local maximum above threshold
-        if (current > prev_val and current > next_val and current > threshold):
-            peak_time = i * time_step
-            # Create a segment around the peak
-            segment_start = max(0, peak_time - 5)  # 5 seconds before
-            segment_end = min(duration, peak_time + 10)  # 10 seconds after
-            
-            peaks.append({
-                "start": segment_start,
-                "end": segment_end,
-                "peak_time": peak_time,
-                "intensity": current
-            })
+        peak = {
+            "start": segment_start,
+            "end": segment_end,
+            "peak_time": peak_time,
+            "intensity": signal_data[i]
+        }
+        if peak_type is not None:
+            peak["type"] = peak_type
+        peaks.append(peak)
     
     return peaks
 
@@ -460,6 +631,25 @@ def analyze_spectral_changes(mfcc_data: List[List[float]], duration: float) -> L
     
     time_step = duration / len(mfcc_data)
     
+    # Rectangular numeric MFCC frames take the vectorized path; ragged or mixed data
+    # keeps the per-element loop below
+    width = len(mfcc_data[0]) if isinstance(mfcc_data[0], list) else -1
+    mfcc = np.asarray(mfcc_data) if all(isinstance(frame, list) and len(frame) == width for frame in mfcc_data) else None
+    if mfcc is not None and mfcc.ndim == 2 and mfcc.dtype.kind in "biuf":
+        diffs = np.diff(mfcc.astype(np.float64), axis=0)
+        flux_values = np.sqrt(np.einsum("ij,ij->i", diffs, diffs))
+        
+        for i in (np.flatnonzero(flux_values > 2.0) + 1).tolist():
+            change_time = i * time_step
+            changes.append({
+                "start": max(0, change_time - 3),
+                "end": min(duration, change_time + 7),
+                "change_time": change_time,
+                "intensity": min(float(flux_values[i - 1]) / 5.0, 1.0)  # Normalize
+            })
+        
+        return changes
+    
     # Calculate spectral flux (measure of change)
     for i in range(1, len(mfcc_data)):
         if isinstance(mfcc_data[i], list) and isinstance(mfcc_data[i-1], list):
@@ -480,195 +670,36 @@ def analyze_spectral_changes(mfcc_data: List[List[float]], duration: float) -> L
     
     return changes
 
-def calculate_chunk_score(chunk: ChunkInput) -> float:
-    """Calculate engagement score for chunk"""
-    score = 0.0
-    
-    # Debug logging
-    logger.info("Scoring chunk", 
-                chunk_id=chunk.chunkId, 
-                has_transcription=bool(chunk.chunkData.transcription),
-                has_vision=bool(chunk.chunkData.vision), 
-                has_audio=bool(chunk.chunkData.audioFeatures),
-                duration=chunk.chunkData.duration)
-    
-    # Transcription scoring
-    if chunk.chunkData.transcription:
-        # Improved text extraction
-        transcription = chunk.chunkData.transcription
-        text = ""
-        
-        if isinstance(transcription, str):
-            text = transcription
-        elif isinstance(transcription, dict):
-            # Try getting text field first
-            text = transcription.get("text", "")
-            
-            # If no text field, extract from segments (Whisper format)
-            if not text and transcription.get("segments"):
-                segments = transcription["segments"]
-                if isinstance(segments, list):
-                    text_parts = []
-                    for seg in segments:
-                        if isinstance(seg, dict) and seg.get("text"):
-                            text_parts.append(seg["text"].strip())
-                    text = " ".join(text_parts)
-                    print(f"🎯 SCORING: Extracted {len(text_parts)} segments from Whisper format")
-            
-            # Fallback: try getting from 'transcript' field
-            if not text and transcription.get("transcript"):
-                text = transcription["transcript"]
-        
-        transcription_score = score_transcription(text)
-        score += transcription_score
-        logger.info("Transcription scoring", chunk_id=chunk.chunkId, text_length=len(text), transcription_score=transcription_score)
-    
-    # Vision scoring  
-    if chunk.chunkData.vision:
-        vision_score = score_vision_data(chunk.chunkData.vision)
-        score += vision_score
-        logger.info("Vision scoring", chunk_id=chunk.chunkId, vision_score=vision_score)
-    
-    # Audio features scoring
-    if chunk.chunkData.audioFeatures:
-        audio_score = score_audio_features(chunk.chunkData.audioFeatures)
-        score += audio_score
-        logger.info("Audio scoring", chunk_id=chunk.chunkId, audio_score=audio_score)
-    
-    # If no data sources, give a minimal base score
-    if not chunk.chunkData.transcription and not chunk.chunkData.vision and not chunk.chunkData.audioFeatures:
-        score = 0.2  # Minimal score for chunks without analysis data
-        logger.info("No analysis data, using base score", chunk_id=chunk.chunkId)
-    
-    # Duration penalty for very short/long chunks
-    duration = chunk.chunkData.duration
-    if duration < 3:
-        score *= 0.5  # Penalty for short clips
-    elif duration > 30:
-        score *= 0.8  # Slight penalty for long clips
-    
-    final_score = min(score, 1.0)  # Cap at 1.0
-    logger.info("Final chunk score", chunk_id=chunk.chunkId, score=final_score, threshold=HIGHLIGHT_THRESHOLD)
-    
-    return final_score
-
-def score_transcription(text: str) -> float:
-    """Score transcription content"""
-    if not text:
-        return 0.0
-    
-    score = 0.0
-    text_lower = text.lower()
-    
-    # Base score for having any transcription
-    score += 0.2
-    
-    # High-priority clip request terms (explicit requests for clipping)
-    clip_request_terms = ["clip it", "clip that", "make a clip", "that's a clip", "clipworthy", "clip worthy"]
-    score += sum(0.3 for term in clip_request_terms if term in text_lower)
-    
-    # Action words boost (expanded list)
-    action_words = ["amazing", "incredible", "wow", "unbelievable", "insane", "perfect", "epic", 
-                   "awesome", "fantastic", "great", "excellent", "outstanding", "brilliant"]
-    score += sum(0.1 for word in action_words if word in text_lower)
-    
-    # Emotion indicators (expanded)
-    emotion_words = ["excited", "shocked", "surprised", "happy", "angry", "love", "hate", 
-                    "crazy", "wild", "intense", "fun", "funny", "hilarious"]
-    score += sum(0.05 for word in emotion_words if word in text_lower)
-    
-    # Gaming/streaming terms
-    gaming_words = ["clutch", "play", "win", "lose", "kill", "death", "score", "points", "level",
-                   "good fight", "gg", "nice", "skilled", "combo", "finish", "victory", "defeat"]
-    score += sum(0.03 for word in gaming_words if word in text_lower)
-    
-    # Length scoring (optimal around 50-200 chars)
-    length_score = min(len(text) / 100, 1.0) * 0.3
-    score += length_score
-    
-    return min(score, 0.8)  # Increased cap for transcription contribution
-
-def score_vision_data(vision_data: Dict[str, Any]) -> float:
-    """Score vision analysis data"""
-    score = 0.0
-    
-    # Base score for having vision data
-    score += 0.1
-    
-    # Face detection boost
-    if vision_data.get("faces_detected", False) or vision_data.get("faces"):
-        score += 0.2
-    
-    # Scene changes indicate action
-    scene_changes = vision_data.get("scene_changes", 0)
-    if isinstance(scene_changes, list):
-        scene_changes = len(scene_changes)
-    score += min(scene_changes * 0.1, 0.3)
-    
-    # Motion intensity
-    motion = vision_data.get("motion_intensity", 0)
-    if motion > 0:
-        score += min(motion * 0.1, 0.2)
-    
-    return min(score, 0.6)  # Increased cap for vision contribution
-
-def score_audio_features(audio_features: Dict[str, Any]) -> float:
-    """Score audio characteristics"""
-    if not audio_features:
-        return 0.0
-    
-    score = 0.0
-    
-    # Base score for having audio features
-    score += 0.1
-    
-    # Energy/volume indicators
-    if audio_features.get("energy"):
-        energy = audio_features["energy"]
-        if isinstance(energy, list) and energy:
-            avg_energy = sum(energy) / len(energy)
-            score += min(avg_energy * 0.2, 0.3)
-    
-    # Loudness indicators
-    loudness = audio_features.get("loudness", 0)
-    if loudness > 0:
-        score += min(loudness * 0.05, 0.2)
-    
-    return min(score, 0.4)
-
-def get_scoring_reasons(chunk: ChunkInput, score: float) -> List[str]:
-    """Get human-readable scoring reasons"""
-    reasons = []
-    
-    if chunk.chunkData.transcription:
-        text = chunk.chunkData.transcription.get("text", "").lower()
-        if any(word in text for word in ["amazing", "incredible", "wow", "unbelievable"]):
-            reasons.append("high_engagement_words")
-    
-    if chunk.chunkData.vision and chunk.chunkData.vision.get("faces_detected"):
-        reasons.append("face_detected")
-        
-    if score > 0.8:
-        reasons.append("high_overall_score")
-    
-    return reasons
-
 async def notify_orchestrator_webhook(stream_id: str, highlights: List[Dict[str, Any]]):
     """Notify orchestrator of completed scoring"""
     try:
         webhook_url = f"{ORCHESTRATOR_URL}/api/v1/processing/webhooks/scoring-complete"
         
-        async with aiohttp.ClientSession() as session:
-            await session.post(webhook_url, json={
-                "streamId": stream_id,
-                "result": {"highlights": highlights}
-            })
+        body = orjson.dumps({
+            "streamId": stream_id,
+            "result": {"highlights": highlights}
+        }, option=orjson.OPT_SERIALIZE_NUMPY)
+        headers = {"Content-Type": "application/json"}
+        
+        # Large highlight arrays compress well; the orchestrator's body-parser inflates gzip
+        if len(body) > WEBHOOK_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
         
-        logger.info("Scoring webhook sent", stream_id=stream_id)
+        async with http_session.post(webhook_url, data=body, headers=headers) as response:
+            logger.info("Scoring webhook sent", stream_id=stream_id, status=response.status)
     except Exception as e:
         logger.error("Failed to send scoring webhook", stream_id=stream_id, error=str(e))
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=SCORING_SERVICE_PORT)
\ No newline at end of file
+    # uvloop/httptools ship with uvicorn[standard]. Stay on one worker: job state is in-process
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=SCORING_SERVICE_PORT,
+        loop="uvloop",
+        http="httptools",
+        access_log=ACCESS_LOG
+    )
\ No newline at end of file
@@ -3,8 +3,42 @@
 Segment creation functions for content-aware highlight detection
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 import math
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from keyword_matcher import KeywordMatcher
+
+# High-intensity speech patterns (see create_speech_based_segments)
+INTENSITY_KEYWORDS = ("wow", "amazing", "incredible", "perfect", "insane", "unbelievable",
+                      "clutch", "epic", "awesome", "brilliant", "outstanding")
+EXCITEMENT_KEYWORDS = ("oh my god", "holy", "damn", "shit", "fuck", "yes!", "no way",
+                       "are you kidding", "you've got to be")
+speech_keyword_matcher = KeywordMatcher(INTENSITY_KEYWORDS + EXCITEMENT_KEYWORDS)
+
+# Single compiled alternations over lowercased text (substring semantics, same as `word in text`)
+CONTEXT_KEYWORD_PATTERN = re.compile("clip|highlight|amazing|incredible|perfect")
+FUSION_SPEECH_KEYWORD_PATTERN = re.compile("amazing|incredible|wow|perfect|insane")
+
+# Event kinds used by fusion clustering, indexed by EventArrays.kinds
+EVENT_KINDS = ("speech", "audio", "vision")
+
+class EventArrays(NamedTuple):
+    """Structure-of-arrays view of a chunk's events, sorted by start time"""
+    starts: np.ndarray
+    ends: np.ndarray
+    kinds: np.ndarray  # index into EVENT_KINDS
+    data: List[Dict[str, Any]]  # source transcription segment / audio peak / vision event
+
+def segment_text_lower(seg: Dict[str, Any]) -> str:
+    """Lowercased transcription segment text, computed once and cached on the segment"""
+    text = seg.get("_text_lower")
+    if text is None:
+        text = seg["_text_lower"] = seg.get("text", "").lower()
+    return text
 
 def create_speech_based_segments(transcription_segments: List[Dict[str, Any]], duration: float) -> List[Dict[str, Any]]:
     """Create highlight segments based on speech content"""
@@ -15,16 +49,12 @@ def create_speech_based_segments(transcription_segments: List[Dict[str, Any]], d
     
     # Group segments by intensity (high-energy speech)
     for seg in transcription_segments:
-        text = seg.get("text", "").lower()
-        
-        # Look for high-intensity speech patterns
-        intensity_keywords = ["wow", "amazing", "incredible", "perfect", "insane", "unbelievable", 
-                            "clutch", "epic", "awesome", "brilliant", "outstanding"]
-        excitement_keywords = ["oh my god", "holy", "damn", "shit", "fuck", "yes!", "no way", 
-                             "are you kidding", "you've got to be"]
+        text = segment_text_lower(seg)
         
-        intensity_score = sum(1 for keyword in intensity_keywords if keyword in text)
-        excitement_score = sum(2 for keyword in excitement_keywords if keyword in text)  # Higher weight
+        # Look for high-intensity speech patterns (one automaton pass for both lists)
+        found_keywords = speech_keyword_matcher.find(text)
+        intensity_score = len(found_keywords.intersection(INTENSITY_KEYWORDS))
+        excitement_score = 2 * len(found_keywords.intersection(EXCITEMENT_KEYWORDS))  # Higher weight
         
         if intensity_score > 0 or excitement_score > 0 or len(text) > 100:
             # Create segment around this speech
@@ -37,12 +67,20 @@ def create_speech_based_segments(transcription_segments: List[Dict[str, Any]], d
                 "type": "speech_based",
                 "source_intensity": intensity_score,
                 "source_excitement": excitement_score,
-                "source_text": text[:100],
-                "reason": f"High-intensity speech: '{text[:50]}...'"
+                "_text": text  # source_text/reason are built by finalize_segments for survivors only
             })
     
     return segments
 
+def finalize_segments(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill in display fields deferred at creation, once pruning has picked the final segments"""
+    for segment in segments:
+        text = segment.pop("_text", None)
+        if text is not None:
+            segment["source_text"] = text[:100]
+            segment["reason"] = f"High-intensity speech: '{text[:50]}...'"
+    return segments
+
 def create_audio_peak_segments(audio_peaks: List[Dict[str, Any]], duration: float) -> List[Dict[str, Any]]:
     """Create highlight segments based on audio energy peaks"""
     segments = []
@@ -104,6 +142,20 @@ def create_vision_event_segments(vision_events: List[Dict[str, Any]], duration:
     
     return segments
 
+def pack_events(transcription_segments: List[Dict[str, Any]], 
+                audio_peaks: List[Dict[str, Any]], 
+                vision_events: List[Dict[str, Any]]) -> EventArrays:
+    """Pack all events of a chunk into parallel arrays sorted (stably) by start time"""
+    sources = (transcription_segments, audio_peaks, vision_events)
+    data = [item for items in sources for item in items]
+    
+    starts = np.array([item["start"] for item in data], dtype=np.float64)
+    ends = np.array([item["end"] for item in data], dtype=np.float64)
+    kinds = np.repeat(np.arange(len(EVENT_KINDS), dtype=np.int8), [len(items) for items in sources])
+    
+    order = np.argsort(starts, kind="stable")
+    return EventArrays(starts[order], ends[order], kinds[order], [data[i] for i in order.tolist()])
+
 def create_fusion_segments(transcription_segments: List[Dict[str, Any]], 
                          audio_peaks: List[Dict[str, Any]], 
                          vision_events: List[Dict[str, Any]], 
@@ -111,116 +163,84 @@ def create_fusion_segments(transcription_segments: List[Dict[str, Any]],
     """Create segments by fusing multiple data sources"""
     segments = []
     
-    # Find temporal overlaps between different modalities
-    all_events = []
-    
-    # Add transcription events
-    for seg in transcription_segments:
-        all_events.append({
-            "start": seg["start"],
-            "end": seg["end"],
-            "type": "speech",
-            "data": seg
-        })
-    
-    # Add audio events
-    for peak in audio_peaks:
-        peak_time = peak.get("peak_time", (peak["start"] + peak["end"]) / 2)
-        all_events.append({
-            "start": peak["start"],
-            "end": peak["end"],
-            "type": "audio",
-            "data": peak,
-            "peak_time": peak_time
-        })
-    
-    # Add vision events
-    for event in vision_events:
-        all_events.append({
-            "start": event["start"],
-            "end": event["end"],
-            "type": "vision",
-            "data": event
-        })
+    if not (transcription_segments or audio_peaks or vision_events):
+        return segments
     
-    # Sort events by start time
-    all_events.sort(key=lambda x: x["start"])
+    # Find temporal overlaps between different modalities
+    events = pack_events(transcription_segments, audio_peaks, vision_events)
     
     # Find clusters of events that occur close together
-    clusters = find_event_clusters(all_events, max_gap=10.0)  # Events within 10 seconds
+    cluster_id = find_event_clusters_np(events.starts, events.ends, max_gap=10.0)  # Events within 10 seconds
+    bounds = np.searchsorted(cluster_id, np.arange(cluster_id[-1] + 2))
+    cluster_starts = np.minimum.reduceat(events.starts, bounds[:-1])
+    cluster_ends = np.maximum.reduceat(events.ends, bounds[:-1])
+    kinds = events.kinds.tolist()
     
     # Create fusion segments from clusters
-    for cluster in clusters:
-        if len(cluster) >= 2:  # At least 2 different types of events
-            cluster_start = min(event["start"] for event in cluster)
-            cluster_end = max(event["end"] for event in cluster)
-            
+    for first, last, cluster_start, cluster_end in zip(bounds[:-1].tolist(), bounds[1:].tolist(),
+                                                       cluster_starts.tolist(), cluster_ends.tolist()):
+        if last - first >= 2:  # At least 2 different types of events
             # Expand segment to create good highlight
             segment_start = max(0, cluster_start - 5)
             segment_end = min(duration, cluster_end + 8)
             segment_duration = segment_end - segment_start
             
+            if segment_duration < 10:  # Minimum requirement, checked before scoring the cluster
+                continue
+            
+            cluster = [
+                {"start": item["start"], "end": item["end"], "type": EVENT_KINDS[kind], "data": item}
+                for item, kind in zip(events.data[first:last], kinds[first:last])
+            ]
+            
             # Calculate fusion score based on event types and overlap
-            fusion_score = calculate_fusion_score(cluster)
+            unique_types = set(event["type"] for event in cluster)
+            fusion_score = calculate_fusion_score(cluster, unique_types, (cluster_start, cluster_end))
             
-            if segment_duration >= 10 and fusion_score > 0.3:  # Minimum requirements
+            if fusion_score > 0.3:  # Minimum requirements
+                source_types = list(unique_types)
                 segments.append({
                     "startTime": segment_start,
                     "duration": segment_duration,
                     "type": "multi_modal_fusion",
                     "source_events": len(cluster),
-                    "source_types": list(set(event["type"] for event in cluster)),
+                    "source_types": source_types,
                     "fusion_score": fusion_score,
-                    "reason": f"Multi-modal event cluster ({len(cluster)} events: {', '.join(set(e['type'] for e in cluster))})"
+                    "reason": f"Multi-modal event cluster ({len(cluster)} events: {', '.join(source_types)})"
                 })
     
     return segments
 
-def find_event_clusters(events: List[Dict[str, Any]], max_gap: float = 10.0) -> List[List[Dict[str, Any]]]:
-    """Group events that occur close together in time"""
-    if not events:
-        return []
-    
-    clusters = []
-    current_cluster = [events[0]]
-    
-    for i in range(1, len(events)):
-        current_event = events[i]
-        last_event = current_cluster[-1]
-        
-        # Check if this event is close enough to the last event in current cluster
-        gap = current_event["start"] - last_event["end"]
-        
-        if gap <= max_gap:
-            current_cluster.append(current_event)
-        else:
-            # Start a new cluster
-            if len(current_cluster) > 0:
-                clusters.append(current_cluster)
-            current_cluster = [current_event]
-    
-    # Add the last cluster
-    if len(current_cluster) > 0:
-        clusters.append(current_cluster)
-    
-    return clusters
+def find_event_clusters_np(starts: np.ndarray, ends: np.ndarray, max_gap: float = 10.0) -> np.ndarray:
+    """Cluster id per event (events in start order): a new cluster begins when the gap
+    from the previous event's end exceeds max_gap"""
+    gaps = starts[1:] - ends[:-1]
+    return np.concatenate(([0], np.cumsum(~(gaps <= max_gap))))
 
-def calculate_fusion_score(event_cluster: List[Dict[str, Any]]) -> float:
-    """Calculate a score for a cluster of multi-modal events"""
+def calculate_fusion_score(event_cluster: List[Dict[str, Any]], unique_types: Optional[set] = None,
+                           cluster_bounds: Optional[Tuple[float, float]] = None) -> float:
+    """Calculate a score for a cluster of multi-modal events
+    
+    unique_types and cluster_bounds (start, end) may be passed in when already known.
+    """
     if not event_cluster:
         return 0.0
     
     score = 0.0
     
     # Bonus for having multiple modalities
-    unique_types = set(event["type"] for event in event_cluster)
+    if unique_types is None:
+        unique_types = set(event["type"] for event in event_cluster)
     modality_bonus = len(unique_types) * 0.15  # 0.15 per unique modality
     score += modality_bonus
     
     # Bonus for temporal density (events close together)
     if len(event_cluster) > 1:
-        cluster_start = min(event["start"] for event in event_cluster)
-        cluster_end = max(event["end"] for event in event_cluster)
+        if cluster_bounds is not None:
+            cluster_start, cluster_end = cluster_bounds
+        else:
+            cluster_start = min(event["start"] for event in event_cluster)
+            cluster_end = max(event["end"] for event in event_cluster)
         cluster_duration = cluster_end - cluster_start
         
         if cluster_duration > 0:
@@ -234,8 +254,8 @@ def calculate_fusion_score(event_cluster: List[Dict[str, Any]]) -> float:
         
         if event["type"] == "speech":
             # Quality based on text content
-            text = event_data.get("text", "").lower()
-            if any(word in text for word in ["amazing", "incredible", "wow", "perfect", "insane"]):
+            text = segment_text_lower(event_data)
+            if FUSION_SPEECH_KEYWORD_PATTERN.search(text):
                 score += 0.2
         
         elif event["type"] == "audio":
@@ -250,23 +270,28 @@ def calculate_fusion_score(event_cluster: List[Dict[str, Any]]) -> float:
     
     return min(score, 1.0)  # Cap at 1.0
 
+@lru_cache(maxsize=256)
+def segment_base_score(segment_type: str) -> float:
+    """Base score for a segment type; only a handful of types exist, so lookups are memoized"""
+    if segment_type.startswith("speech"):
+        return 0.3
+    elif segment_type.startswith("audio"):
+        return 0.25
+    elif segment_type.startswith("vision"):
+        return 0.2
+    elif segment_type == "multi_modal_fusion":
+        return 0.4
+    return 0.0
+
 def score_highlight_segment(segment: Dict[str, Any], chunk: Any, 
                           transcription_segments: List[Dict[str, Any]],
                           audio_peaks: List[Dict[str, Any]], 
-                          vision_events: List[Dict[str, Any]]) -> float:
+                          vision_events: List[Dict[str, Any]],
+                          event_index: Optional[List[Tuple[np.ndarray, np.ndarray, List[float]]]] = None) -> float:
     """Score a highlight segment based on content and context"""
-    score = 0.0
-    
     # Base score from segment type
     segment_type = segment.get("type", "unknown")
-    if segment_type.startswith("speech"):
-        score += 0.3
-    elif segment_type.startswith("audio"):
-        score += 0.25
-    elif segment_type.startswith("vision"):
-        score += 0.2
-    elif segment_type == "multi_modal_fusion":
-        score += 0.4
+    score = segment_base_score(segment_type)
     
     # Bonus from source intensity/excitement
     score += segment.get("source_intensity", 0) * 0.1
@@ -287,36 +312,57 @@ def score_highlight_segment(segment: Dict[str, Any], chunk: Any,
         score *= 0.8  # Slight penalty for long
     
     # Context bonuses (overlap with other events)
-    context_bonus = calculate_context_bonus(segment, transcription_segments, audio_peaks, vision_events)
+    context_bonus = calculate_context_bonus(segment, transcription_segments, audio_peaks, vision_events,
+                                            event_index)
     score += context_bonus
     
     return min(score, 1.0)
 
+def build_event_index(transcription_segments: List[Dict[str, Any]],
+                      audio_peaks: List[Dict[str, Any]], 
+                      vision_events: List[Dict[str, Any]]) -> List[Tuple[np.ndarray, np.ndarray, List[float]]]:
+    """Start/end arrays and per-event context bonus for each event list, built once per chunk"""
+    index = []
+    
+    # Transcription segments only count when they mention clip-worthy words
+    trans_bonus = []
+    for trans_seg in transcription_segments:
+        text = segment_text_lower(trans_seg)
+        trans_bonus.append(0.1 if CONTEXT_KEYWORD_PATTERN.search(text) else 0.0)
+    index.append((transcription_segments, trans_bonus))
+    
+    index.append((audio_peaks, [peak.get("intensity", 0.5) * 0.05 for peak in audio_peaks]))
+    index.append((vision_events, [event.get("intensity", event.get("confidence", 0.5)) * 0.03 for event in vision_events]))
+    
+    return [
+        (np.array([e["start"] for e in events], dtype=np.float64),
+         np.array([e["end"] for e in events], dtype=np.float64),
+         bonuses)
+        for events, bonuses in index
+    ]
+
 def calculate_context_bonus(segment: Dict[str, Any],
                           transcription_segments: List[Dict[str, Any]],
                           audio_peaks: List[Dict[str, Any]], 
-                          vision_events: List[Dict[str, Any]]) -> float:
-    """Calculate bonus score based on context and overlaps with other events"""
+                          vision_events: List[Dict[str, Any]],
+                          event_index: Optional[List[Tuple[np.ndarray, np.ndarray, List[float]]]] = None) -> float:
+    """Calculate bonus score based on context and overlaps with other events
+    
+    Pass event_index (from build_event_index) when scoring many segments of one chunk.
+    """
+    if event_index is None:
+        if not (transcription_segments or audio_peaks or vision_events):
+            return 0.0
+        event_index = build_event_index(transcription_segments, audio_peaks, vision_events)
+    
     bonus = 0.0
     segment_start = segment["startTime"]
     segment_end = segment_start + segment["duration"]
     
-    # Check for overlaps with transcription segments
-    for trans_seg in transcription_segments:
-        if overlaps(segment_start, segment_end, trans_seg["start"], trans_seg["end"]):
-            text = trans_seg.get("text", "").lower()
-            if any(word in text for word in ["clip", "highlight", "amazing", "incredible", "perfect"]):
-                bonus += 0.1
-    
-    # Check for overlaps with audio peaks
-    for peak in audio_peaks:
-        if overlaps(segment_start, segment_end, peak["start"], peak["end"]):
-            bonus += peak.get("intensity", 0.5) * 0.05
-    
-    # Check for overlaps with vision events
-    for event in vision_events:
-        if overlaps(segment_start, segment_end, event["start"], event["end"]):
-            bonus += event.get("intensity", event.get("confidence", 0.5)) * 0.03
+    # Overlapping transcription segments, audio peaks and vision events, in that order
+    for starts, ends, bonuses in event_index:
+        for i in np.flatnonzero((segment_start < ends) & (starts < segment_end)).tolist():
+            bonus += bonuses[i]
     
     return min(bonus, 0.3)  # Cap bonus
 
@@ -353,32 +399,22 @@ def remove_overlapping_segments(segments: List[Dict[str, Any]]) -> List[Dict[str
     # Sort by score descending
     sorted_segments = sorted(segments, key=lambda x: x.get("score", 0), reverse=True)
     
+    starts = np.array([segment["startTime"] for segment in sorted_segments], dtype=np.float64)
+    durations = np.array([segment["duration"] for segment in sorted_segments], dtype=np.float64)
+    ends = starts + durations
+    
+    # Greedy NMS: each kept segment suppresses every candidate it overlaps significantly
+    # (>50% of either segment), so the Python loop only does work per kept segment
+    suppressed = np.zeros(len(sorted_segments), dtype=bool)
     final_segments = []
     
-    for segment in sorted_segments:
-        start = segment["startTime"]
-        end = start + segment["duration"]
-        
-        # Check if this segment overlaps significantly with any already selected segment
-        overlaps_existing = False
-        for existing in final_segments:
-            existing_start = existing["startTime"]
-            existing_end = existing_start + existing["duration"]
-            
-            # Check for significant overlap (>50% of either segment)
-            overlap_start = max(start, existing_start)
-            overlap_end = min(end, existing_end)
-            overlap_duration = max(0, overlap_end - overlap_start)
-            
-            segment_overlap_pct = overlap_duration / segment["duration"]
-            existing_overlap_pct = overlap_duration / existing["duration"]
-            
-            if segment_overlap_pct > 0.5 or existing_overlap_pct > 0.5:
-                overlaps_existing = True
-                break
+    for i, segment in enumerate(sorted_segments):
+        if suppressed[i]:
+            continue
+        final_segments.append(segment)
         
-        if not overlaps_existing:
-            final_segments.append(segment)
+        overlap_duration = np.maximum(0, np.minimum(ends, ends[i]) - np.maximum(starts, starts[i]))
+        suppressed |= (overlap_duration / durations > 0.5) | (overlap_duration / durations[i] > 0.5)
     
     # Sort final segments by start time
     final_segments.sort(key=lambda x: x["startTime"])
@@ -6,11 +6,12 @@ Integrated with ClipForge orchestrator webhook system
 """
 
 import os
-import json
+import base64
 import asyncio
 import uuid
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -19,8 +20,11 @@ from datetime import datetime
 import structlog
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import aiohttp
+import orjson
+from cachetools import TTLCache
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 # S3 integration
@@ -66,9 +70,28 @@ SERVICE_PORT = int(os.getenv("VISION_SERVICE_PORT", "8003"))
 ANALYSIS_STORAGE_PATH = os.getenv("ANALYSIS_STORAGE_PATH", "./data/analysis")
 FACE_MODEL_NAME = os.getenv("FACE_MODEL_NAME", "buffalo_l")
 MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_VISION_JOBS", "2"))
+JOB_CACHE_MAXSIZE = int(os.getenv("JOB_CACHE_MAXSIZE", "10000"))
+JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", "3600"))  # seconds
+VISION_WORKERS = int(os.getenv("VISION_WORKERS", str(MAX_CONCURRENT_JOBS)))
 SCENE_THRESHOLD = float(os.getenv("SCENE_THRESHOLD", "30.0"))
 MIN_SCENE_LENGTH = float(os.getenv("MIN_SCENE_LENGTH", "3.0"))
 
+# Video decoding
+VIDEO_HW_ACCELERATION = os.getenv("VIDEO_HW_ACCELERATION", "any")  # "any" or "none"
+VIDEO_DECODE_THREADS = int(os.getenv("VIDEO_DECODE_THREADS", "0"))  # 0 lets FFmpeg decide
+# Decode S3 chunks over HTTP(S) from a presigned URL, so decoding starts before the
+# download would have finished; falls back to downloading a temp file if the stream
+# can't be opened or ends early
+VIDEO_STREAM_FROM_S3 = os.getenv("VIDEO_STREAM_FROM_S3", "false").lower() == "true"
+VIDEO_HW_DEVICE = int(os.getenv("VIDEO_HW_DEVICE", "-1"))  # GPU index for NVDEC/VAAPI, -1 for the default
+
+# OpenCV threads per pool worker process; parallelism comes from the worker processes
+CV_NUM_THREADS = int(os.getenv("CV_NUM_THREADS", "1"))
+
+# Dominant color extraction
+DOMINANT_COLOR_SAMPLE_SIZE = (160, 90)  # (width, height) frames are shrunk to before k-means
+KMEANS_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
+
 # Orchestrator webhook configuration
 ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:3001")
 VISION_WEBHOOK_ENDPOINT = "/api/v1/processing/webhooks/vision-complete"
@@ -106,7 +129,7 @@ class FaceInfo(BaseModel):
     age: Optional[float] = None
     gender: Optional[str] = None
     emotion: Optional[str] = None
-    embedding: Optional[List[float]] = None
+    embedding_fp16_b64: Optional[str] = None  # base64 of the float16 embedding bytes
 
 class FrameAnalysis(BaseModel):
     timestamp: float
@@ -146,18 +169,32 @@ class HealthResponse(BaseModel):
 # Global variables
 face_analyzer: Optional[FaceAnalysis] = None
 s3_client: Optional[S3Client] = None
+http_session: Optional[aiohttp.ClientSession] = None
 processing_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
-processing_jobs: Dict[str, Dict[str, Any]] = {}  # Store job status
+process_pool: Optional[ProcessPoolExecutor] = None
+# Job status only; completed analyses are served from their saved files
+processing_jobs: TTLCache = TTLCache(maxsize=JOB_CACHE_MAXSIZE, ttl=JOB_CACHE_TTL)
 
 # Lifespan event handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global http_session, process_pool
+    
     # Startup
     logger.info("Starting Vision Service", port=SERVICE_PORT)
     
     # Create storage directories
     os.makedirs(ANALYSIS_STORAGE_PATH, exist_ok=True)
     
+    # One pooled session so webhooks (and their retries) reuse keep-alive connections
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+    
+    # Worker processes for CPU-bound video analysis, one per concurrent job
+    process_pool = ProcessPoolExecutor(max_workers=VISION_WORKERS, initializer=init_worker)
+    
     # Initialize S3 client
     init_s3()
     # Note: Face analyzer initialization is optional for basic functionality
@@ -171,6 +208,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Vision Service")
+    await http_session.close()
+    http_session = None
+    process_pool.shutdown(wait=False, cancel_futures=True)
+    process_pool = None
 
 # Create app with lifespan
 app = FastAPI(title="Vision Service", lifespan=lifespan)
@@ -184,6 +225,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def init_worker():
+    """Per-process setup for analysis pool workers"""
+    cv2.setNumThreads(CV_NUM_THREADS)
+
 def init_s3():
     """Initialize S3 client"""
     global s3_client
@@ -215,35 +260,47 @@ async def notify_orchestrator(stream_id: str, chunk_id: str, vision_result: Dict
     """Notify orchestrator about vision analysis completion via webhook"""
     try:
         webhook_url = f"{ORCHESTRATOR_URL}{VISION_WEBHOOK_ENDPOINT}"
-        payload = {
+        body = orjson.dumps({
             "streamId": stream_id,
             "chunkId": chunk_id,
             "result": vision_result
-        }
+        }, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+        headers = {"Content-Type": "application/json"}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(webhook_url, json=payload) as response:
-                if response.status == 200:
-                    logger.info("Orchestrator webhook called successfully", 
-                               chunk_id=chunk_id, webhook_url=webhook_url)
-                else:
-                    error_text = await response.text()
-                    logger.error("Orchestrator webhook failed", 
-                                chunk_id=chunk_id, 
-                                status=response.status,
-                                error=error_text)
+        async with http_session.post(webhook_url, data=body, headers=headers) as response:
+            if response.status == 200:
+                logger.info("Orchestrator webhook called successfully", 
+                           chunk_id=chunk_id, webhook_url=webhook_url)
+            else:
+                error_text = await response.text()
+                logger.error("Orchestrator webhook failed", 
+                            chunk_id=chunk_id, 
+                            status=response.status,
+                            error=error_text)
                     
     except Exception as e:
         logger.error("Failed to notify orchestrator", chunk_id=chunk_id, error=str(e))
         # Don't re-raise - webhook failures shouldn't fail the job
 
+def open_video(video_path: str) -> cv2.VideoCapture:
+    """Open a video with FFmpeg, preferring hardware-accelerated, multi-threaded decoding"""
+    acceleration = cv2.VIDEO_ACCELERATION_ANY if VIDEO_HW_ACCELERATION == "any" else cv2.VIDEO_ACCELERATION_NONE
+    params = [
+        cv2.CAP_PROP_HW_ACCELERATION, acceleration,
+        cv2.CAP_PROP_N_THREADS, VIDEO_DECODE_THREADS
+    ]
+    if acceleration != cv2.VIDEO_ACCELERATION_NONE and VIDEO_HW_DEVICE >= 0:
+        # Decode on the configured GPU rather than whichever FFmpeg picks
+        params += [cv2.CAP_PROP_HW_DEVICE, VIDEO_HW_DEVICE]
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
+    if not cap.isOpened():
+        # Fall back to default backend selection if FFmpeg rejects the open parameters
+        cap = cv2.VideoCapture(video_path)
+    return cap
+
 def detect_scenes(video_path: str) -> List[SceneInfo]:
     """Detect scenes in video using PySceneDetect"""
     try:
-        # Create video manager
-        video_manager = VideoManager([video_path])
-        stats_manager = StatsManager()
-        
         # Detect scenes using content detector
         scene_list = detect(video_path, ContentDetector(threshold=SCENE_THRESHOLD))
         
@@ -279,9 +336,18 @@ def detect_scenes(video_path: str) -> List[SceneInfo]:
         logger.error("Scene detection failed", video_path=video_path, error=str(e))
         raise
 
+def laplacian_variance(gray: np.ndarray) -> float:
+    """Variance of the Laplacian, used as a sharpness score
+    
+    The Laplacian of a uint8 image fits in int16, so CV_16S keeps it exact
+    without a float64 copy of the frame.
+    """
+    _, stddev = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+    return float(stddev[0, 0] ** 2)
+
 def analyze_scene_properties(video_path: str, start_time: float, end_time: float) -> Dict[str, float]:
     """Analyze visual properties of a scene"""
-    cap = cv2.VideoCapture(video_path)
+    cap = open_video(video_path)
     fps = cap.get(cv2.CAP_PROP_FPS)
     
     start_frame = int(start_time * fps)
@@ -292,41 +358,60 @@ def analyze_scene_properties(video_path: str, start_time: float, end_time: float
     color_variances = []
     shot_changes = 0
     
-    prev_frame = None
+    prev_small = None
     prev_hist = None
     
+    # Decode and resize into the same buffers every iteration (the quarter-scale
+    # frame alternates with prev_small)
+    frame_buf = None
+    gray_buf = None
+    spare_small = None
+    flow = None
+    
+    # Sample the scene at ~4 Hz; frames between samples are grabbed but not retrieved
+    stride = max(1, int(fps / 4))
+    
     cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
     
-    for frame_idx in range(start_frame, min(end_frame, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))):
-        ret, frame = cap.read()
+    for frame_idx in range(start_frame, min(end_frame, int(cap.get(cv2.CAP_PROP_FRAME_COUNT))), stride):
+        if frame_idx > start_frame:
+            for _ in range(stride - 1):
+                cap.grab()
+        ret, frame_buf = cap.read(frame_buf)
         if not ret:
             break
         
-        # Calculate brightness
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        brightness = np.mean(gray)
+        gray_buf = cv2.cvtColor(frame_buf, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+        
+        # One pass over the BGR frame gives both per-channel means and deviations
+        mean, stddev = cv2.meanStdDev(frame_buf)
+        
+        # Calculate brightness (luma of the channel means, i.e. the mean of the gray frame)
+        brightness = float(0.114 * mean[0, 0] + 0.587 * mean[1, 0] + 0.299 * mean[2, 0])
         brightness_values.append(brightness)
         
-        # Calculate motion (optical flow magnitude)
-        if prev_frame is not None:
-            flow = cv2.calcOpticalFlowPyrLK(prev_frame, gray, None, None)
-            if flow[0] is not None:
-                motion = np.mean(np.sqrt(flow[0][:, 0]**2 + flow[0][:, 1]**2))
-                motion_values.append(motion)
+        # Calculate motion (dense optical flow magnitude on a quarter-scale frame)
+        small = cv2.resize(gray_buf, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA, dst=spare_small)
+        if prev_small is not None:
+            flow = cv2.calcOpticalFlowFarneback(prev_small, small, flow, 0.5, 2, 15, 2, 5, 1.1, 0)
+            motion = float(cv2.magnitude(flow[..., 0], flow[..., 1]).mean())
+            motion_values.append(motion)
         
-        # Calculate color variance
-        color_var = np.var(frame.reshape(-1, 3), axis=0).mean()
+        # Calculate color variance (mean of the per-channel variances)
+        color_var = float((stddev ** 2).mean())
         color_variances.append(color_var)
         
-        # Detect shot changes using histogram comparison
+        # Detect shot changes using normalized luma histogram comparison
+        hist = cv2.calcHist([gray_buf], [0], None, [64], [0, 256])
+        cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
         if prev_hist is not None:
-            hist = cv2.calcHist([frame], [0, 1, 2], None, [50, 50, 50], [0, 256, 0, 256, 0, 256])
             correlation = cv2.compareHist(prev_hist, hist, cv2.HISTCMP_CORREL)
             if correlation < 0.7:  # Threshold for shot change
                 shot_changes += 1
         
-        prev_frame = gray
-        prev_hist = cv2.calcHist([frame], [0, 1, 2], None, [50, 50, 50], [0, 256, 0, 256, 0, 256])
+        spare_small = prev_small
+        prev_small = small
+        prev_hist = hist
     
     cap.release()
     
@@ -339,7 +424,7 @@ def analyze_scene_properties(video_path: str, start_time: float, end_time: float
 
 def extract_key_frames(video_path: str, num_frames: int = 10) -> List[Tuple[float, np.ndarray]]:
     """Extract key frames from video for analysis"""
-    cap = cv2.VideoCapture(video_path)
+    cap = open_video(video_path)
     fps = cap.get(cv2.CAP_PROP_FPS)
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     duration = total_frames / fps
@@ -359,39 +444,54 @@ def extract_key_frames(video_path: str, num_frames: int = 10) -> List[Tuple[floa
     cap.release()
     return key_frames
 
-def analyze_frame(frame: np.ndarray, timestamp: float) -> FrameAnalysis:
-    """Analyze a single frame for visual features"""
+def encode_embedding(embedding: np.ndarray) -> str:
+    """Pack a face embedding as base64 float16 (cosine similarity is unaffected in practice)"""
+    return base64.b64encode(np.asarray(embedding, dtype=np.float16).tobytes()).decode('ascii')
+
+def analyze_frame(
+    frame: np.ndarray,
+    timestamp: float,
+    do_colors: bool = True,
+    do_sharpness: bool = True,
+    do_faces: bool = True
+) -> FrameAnalysis:
+    """Analyze a single frame for visual features (disabled features are left empty)"""
     # Calculate brightness
     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     brightness = float(np.mean(gray))
     
     # Calculate sharpness using Laplacian variance
-    sharpness = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+    sharpness = laplacian_variance(gray) if do_sharpness else 0.0
     
-    # Extract dominant colors
-    pixels = frame.reshape(-1, 3)
-    from sklearn.cluster import KMeans
-    kmeans = KMeans(n_clusters=5, random_state=42, n_init=10)
-    kmeans.fit(pixels)
-    dominant_colors = [color.astype(int).tolist() for color in kmeans.cluster_centers_]
+    # Extract dominant colors (k-means on a downsampled copy of the frame)
+    dominant_colors = []
+    if do_colors:
+        small = cv2.resize(frame, DOMINANT_COLOR_SAMPLE_SIZE, interpolation=cv2.INTER_AREA)
+        pixels = small.reshape(-1, 3).astype(np.float32)
+        cv2.setRNGSeed(42)
+        _, _, centers = cv2.kmeans(pixels, 5, None, KMEANS_CRITERIA, 1, cv2.KMEANS_PP_CENTERS)
+        dominant_colors = [color.astype(int).tolist() for color in centers]
     
     # Face detection
     faces = []
-    if face_analyzer:
+    if do_faces and face_analyzer:
         try:
             # Convert BGR to RGB for InsightFace
             rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             detected_faces = face_analyzer.get(rgb_frame)
             
             for i, face in enumerate(detected_faces):
+                # Face returns None for missing attributes, so hasattr can't tell whether
+                # genderage ran (not every model pack includes it)
+                age = face.get('age')
                 face_info = FaceInfo(
                     face_id=f"face_{timestamp}_{i}",
                     confidence=float(face.det_score),
                     bbox=face.bbox.tolist(),
                     landmarks=face.kps.tolist(),
-                    age=float(face.age) if hasattr(face, 'age') else None,
-                    gender=face.gender if hasattr(face, 'gender') else None,
-                    embedding=face.embedding.tolist() if hasattr(face, 'embedding') else None
+                    age=float(age) if age is not None else None,
+                    gender=face.sex,  # "M"/"F" from the 0/1 gender, None without genderage
+                    embedding_fp16_b64=encode_embedding(face.embedding) if face.embedding is not None else None
                 )
                 faces.append(face_info)
         except Exception as e:
@@ -407,7 +507,11 @@ def analyze_frame(frame: np.ndarray, timestamp: float) -> FrameAnalysis:
     )
 
 async def analyze_chunk(chunk_path: str, analysis_types: List[str]) -> Dict[str, Any]:
-    """Perform comprehensive analysis on video chunk"""
+    """Perform comprehensive analysis on video chunk
+    
+    Not called by the /analyze job path, which runs analyze_chunk_from_s3 ->
+    analyze_video_file; nothing else calls it either.
+    """
     start_time = datetime.utcnow()
     
     try:
@@ -415,43 +519,47 @@ async def analyze_chunk(chunk_path: str, analysis_types: List[str]) -> Dict[str,
         if not os.path.exists(chunk_path):
             raise FileNotFoundError(f"Chunk file not found: {chunk_path}")
         
+        results = {
+            "scenes": [],
+            "key_frames": [],
+            "face_summary": {"total_faces": 0, "unique_faces": 0, "avg_confidence": 0.0}
+        }
+        
         # Get video metadata
-        cap = cv2.VideoCapture(chunk_path)
+        cap = open_video(chunk_path)
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         video_metadata = {
             "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
             "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-            "fps": cap.get(cv2.CAP_PROP_FPS),
-            "frame_count": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-            "duration": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) / cap.get(cv2.CAP_PROP_FPS)
+            "fps": fps,
+            "frame_count": frame_count,
+            "duration": frame_count / fps
         }
         cap.release()
         
-        results = {
-            "scenes": [],
-            "key_frames": [],
-            "face_summary": {"total_faces": 0, "unique_faces": 0, "avg_confidence": 0.0}
-        }
-        
         # Scene detection
         if "scenes" in analysis_types:
             logger.info("Performing scene detection", chunk_path=chunk_path)
             results["scenes"] = detect_scenes(chunk_path)
         
+        # "frames" covers every per-frame feature; "faces"/"colors"/"sharpness" pick them individually
+        do_faces = "faces" in analysis_types or "frames" in analysis_types
+        do_colors = "frames" in analysis_types or "colors" in analysis_types
+        do_sharpness = "frames" in analysis_types or "sharpness" in analysis_types
+        analyze_frames = do_faces or do_colors or do_sharpness
+        
         # Frame analysis
-        if "faces" in analysis_types or "frames" in analysis_types:
+        if analyze_frames:
             logger.info("Extracting and analyzing key frames", chunk_path=chunk_path)
             key_frames = extract_key_frames(chunk_path, num_frames=15)
+            frame_analyses = [
+                analyze_frame(frame, timestamp, do_colors, do_sharpness, do_faces)
+                for timestamp, frame in key_frames
+            ]
             
-            frame_analyses = []
-            total_faces = 0
-            face_confidences = []
-            
-            for timestamp, frame in key_frames:
-                frame_analysis = analyze_frame(frame, timestamp)
-                frame_analyses.append(frame_analysis)
-                
-                total_faces += len(frame_analysis.faces)
-                face_confidences.extend([face.confidence for face in frame_analysis.faces])
+            total_faces = sum(len(frame_analysis.faces) for frame_analysis in frame_analyses)
+            face_confidences = [face.confidence for frame_analysis in frame_analyses for face in frame_analysis.faces]
             
             results["key_frames"] = frame_analyses
             results["face_summary"] = {
@@ -475,92 +583,137 @@ async def analyze_chunk(chunk_path: str, analysis_types: List[str]) -> Dict[str,
         logger.error("Chunk analysis failed", chunk_path=chunk_path, error=str(e))
         raise
 
+def _json_default(obj: Any) -> Any:
+    """orjson fallback: dump Pydantic models, stringify anything else"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
 async def save_analysis(chunk_id: str, analysis_data: Dict[str, Any]):
     """Save analysis results to storage"""
     try:
         os.makedirs(ANALYSIS_STORAGE_PATH, exist_ok=True)
         analysis_file = os.path.join(ANALYSIS_STORAGE_PATH, f"{chunk_id}_vision.json")
         
-        # Convert Pydantic models to dict for JSON serialization
-        serializable_data = {}
-        for key, value in analysis_data.items():
-            if hasattr(value, 'dict'):
-                serializable_data[key] = [item.dict() for item in value] if isinstance(value, list) else value.dict()
-            else:
-                serializable_data[key] = value
-        
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(serializable_data, f, indent=2, ensure_ascii=False, default=str)
+        # orjson serializes numpy values and datetimes (naive ones as UTC, per utcnow) natively,
+        # and Pydantic models via _json_default
+        with open(analysis_file, 'wb') as f:
+            f.write(orjson.dumps(
+                analysis_data,
+                default=_json_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_INDENT_2
+            ))
         
         logger.info("Analysis saved", chunk_id=chunk_id, file_path=analysis_file)
     except Exception as e:
         logger.error("Failed to save analysis", chunk_id=chunk_id, error=str(e))
         raise
 
+def get_sample_interval(fps: float) -> int:
+    """Frames between the brightness samples analyze_video_file takes (every 2 seconds)"""
+    return int(fps * 2) if fps > 0 else 30
+
+def analyze_video_file(video_path: str) -> Dict[str, Any]:
+    """Basic video analysis of a chunk file or URL (runs in a pool worker process)"""
+    analysis_result = {
+        "sceneChanges": [],
+        "faces": [],
+        "motionIntensity": [],
+        "colorHistogram": [],
+        "processing_time": 0,
+        "metadata": {}
+    }
+    
+    # Get video metadata using OpenCV
+    cap = open_video(video_path)
+    if cap.isOpened():
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        duration = frame_count / fps if fps > 0 else 0
+        
+        analysis_result["metadata"] = {
+            "fps": fps,
+            "frame_count": frame_count,
+            "width": width,
+            "height": height,
+            "duration": duration
+        }
+        
+        # Simple scene analysis - sample frames every 2 seconds
+        scene_changes = []
+        frame_interval = get_sample_interval(fps)
+        
+        # Read sequentially, retrieving only the sampled frames; seeking to each one
+        # would re-decode from the previous keyframe every time
+        frame_buf = None
+        gray_buf = None
+        for frame_num in range(0, frame_count, frame_interval):
+            if frame_num > 0:
+                for _ in range(frame_interval - 1):
+                    cap.grab()
+            ret, frame_buf = cap.read(frame_buf)
+            if not ret:
+                break
+            gray_buf = cv2.cvtColor(frame_buf, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+            timestamp = frame_num / fps if fps > 0 else 0
+            scene_changes.append({
+                "timestamp": timestamp,
+                "frame_num": frame_num,
+                "brightness": float(np.mean(gray_buf))
+            })
+        
+        analysis_result["sceneChanges"] = scene_changes
+        cap.release()
+    
+    return analysis_result
+
 async def analyze_chunk_from_s3(s3_url: str, chunk_id: str, analysis_type: str = "full") -> Dict[str, Any]:
     """Analyze video chunk from S3 URL using computer vision"""
     start_time = datetime.utcnow()
     local_file_path = None
     
     try:
+        # Extract S3 key from URL
+        s3_key = s3_url.split(f"{S3_BUCKET_NAME}/")[-1]
+        
+        # OpenCV work runs in the process pool so it neither blocks the event loop nor holds its GIL
+        loop = asyncio.get_running_loop()
+        
+        if VIDEO_STREAM_FROM_S3:
+            presigned_url = await asyncio.to_thread(s3_client.get_presigned_url, s3_key)
+            if presigned_url:
+                analysis_result = await loop.run_in_executor(process_pool, analyze_video_file, presigned_url)
+                metadata = analysis_result["metadata"]
+                # A dropped connection ends decoding like the end of the file would, so
+                # a stream that stopped short of the container's frame count was cut off
+                expected_samples = (
+                    len(range(0, metadata["frame_count"], get_sample_interval(metadata["fps"])))
+                    if metadata else None
+                )
+                if metadata and len(analysis_result["sceneChanges"]) >= expected_samples:
+                    logger.info("Analyzed chunk streamed from S3", chunk_id=chunk_id, s3_key=s3_key)
+                    analysis_result["processing_time"] = (datetime.utcnow() - start_time).total_seconds()
+                    return analysis_result
+                logger.warning("Streamed chunk ended early",
+                               chunk_id=chunk_id,
+                               samples=len(analysis_result["sceneChanges"]),
+                               expected_samples=expected_samples)
+            logger.warning("Could not stream chunk from S3, downloading it", chunk_id=chunk_id, s3_key=s3_key)
+        
         # Download file from S3 to temporary location
         with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
             local_file_path = temp_file.name
         
-        # Extract S3 key from URL
-        s3_key = s3_url.split(f"{S3_BUCKET_NAME}/")[-1]
-        
-        # Download file from S3
-        success = s3_client.download_file(s3_key, local_file_path)
+        # Download file from S3 (boto3 is blocking)
+        success = await asyncio.to_thread(s3_client.download_file, s3_key, local_file_path)
         if not success:
             raise Exception(f"Failed to download file from S3: {s3_url}")
         
         logger.info("Downloaded chunk from S3", chunk_id=chunk_id, s3_key=s3_key)
         
-        # Perform basic video analysis
-        analysis_result = {
-            "sceneChanges": [],
-            "faces": [],
-            "motionIntensity": [],
-            "colorHistogram": [],
-            "processing_time": 0,
-            "metadata": {}
-        }
-        
-        # Get video metadata using OpenCV
-        cap = cv2.VideoCapture(local_file_path)
-        if cap.isOpened():
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            duration = frame_count / fps if fps > 0 else 0
-            
-            analysis_result["metadata"] = {
-                "fps": fps,
-                "frame_count": frame_count,
-                "width": width,
-                "height": height,
-                "duration": duration
-            }
-            
-            # Simple scene analysis - sample frames every 2 seconds
-            scene_changes = []
-            frame_interval = int(fps * 2) if fps > 0 else 30
-            
-            for frame_num in range(0, frame_count, frame_interval):
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-                ret, frame = cap.read()
-                if ret:
-                    timestamp = frame_num / fps if fps > 0 else 0
-                    scene_changes.append({
-                        "timestamp": timestamp,
-                        "frame_num": frame_num,
-                        "brightness": np.mean(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
-                    })
-            
-            analysis_result["sceneChanges"] = scene_changes
-            cap.release()
+        analysis_result = await loop.run_in_executor(process_pool, analyze_video_file, local_file_path)
         
         processing_time = (datetime.utcnow() - start_time).total_seconds()
         analysis_result["processing_time"] = processing_time
@@ -615,7 +768,6 @@ async def process_vision_job(request: ChunkAnalysisRequest, stream_id: str):
             # Update job status
             processing_jobs[chunk_id] = {
                 "status": "completed",
-                "analysis": analysis_result,
                 "completed_at": datetime.utcnow().isoformat()
             }
             
@@ -673,20 +825,27 @@ async def analyze_chunk_endpoint(
         logger.error("Failed to start vision analysis job", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
+def stream_completed_analysis(analysis_file: str) -> StreamingResponse:
+    """Wrap a saved analysis file in a completed status without parsing it"""
+    def body():
+        yield b'{"status":"completed","analysis":'
+        with open(analysis_file, 'rb') as f:
+            while chunk := f.read(64 * 1024):
+                yield chunk
+        yield b',"error":null}'
+    
+    return StreamingResponse(body(), media_type="application/json")
+
 @app.get("/analysis/{chunk_id}", response_model=VisionAnalysisStatus)
 async def get_analysis_status(chunk_id: str):
     """Get vision analysis status for a chunk (matches orchestrator polling)"""
     try:
+        analysis_file = os.path.join(ANALYSIS_STORAGE_PATH, f"{chunk_id}_vision.json")
+        
         # Check in-memory job status first
-        if chunk_id in processing_jobs:
-            job_status = processing_jobs[chunk_id]
-            
-            if job_status["status"] == "completed":
-                return VisionAnalysisStatus(
-                    status="completed",
-                    analysis=job_status["analysis"]
-                )
-            elif job_status["status"] == "failed":
+        job_status = processing_jobs.get(chunk_id)
+        if job_status is not None and job_status["status"] != "completed":
+            if job_status["status"] == "failed":
                 return VisionAnalysisStatus(
                     status="failed",
                     error=job_status.get("error", "Unknown error")
@@ -696,17 +855,9 @@ async def get_analysis_status(chunk_id: str):
                     status="processing"
                 )
         
-        # Check saved analysis file as fallback
-        analysis_file = os.path.join(ANALYSIS_STORAGE_PATH, f"{chunk_id}_vision.json")
-        
+        # Completed (or no longer tracked) jobs are served straight from the saved file
         if os.path.exists(analysis_file):
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                analysis_data = json.load(f)
-            
-            return VisionAnalysisStatus(
-                status="completed",
-                analysis=analysis_data
-            )
+            return stream_completed_analysis(analysis_file)
         
         # Job not found
         raise HTTPException(status_code=404, detail="Vision analysis job not found")
@@ -725,6 +876,7 @@ async def delete_analysis(chunk_id: str):
         
         if os.path.exists(analysis_file):
             os.remove(analysis_file)
+            processing_jobs.pop(chunk_id, None)
             logger.info("Analysis deleted", chunk_id=chunk_id)
             return {"status": "deleted", "chunk_id": chunk_id}
         else:
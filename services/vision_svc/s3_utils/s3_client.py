@@ -4,14 +4,86 @@ Provides unified S3 operations for both LocalStack (dev) and AWS S3 (production)
 """
 
 import os
+import time
+import asyncio
+import hashlib
+import threading
 import boto3
 import logging
-from typing import Optional, Tuple
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from boto3.s3.transfer import TransferConfig
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from urllib.parse import urljoin
+from urllib.parse import quote, urljoin
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+# Multipart transfers: files above the threshold move in parallel parts
+S3_MAX_CONCURRENCY = int(os.getenv('S3_MAX_CONCURRENCY', '10'))
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=16 * MB,
+    max_concurrency=S3_MAX_CONCURRENCY,
+    use_threads=True
+)
+
+# Enough pooled connections for every transfer thread, plus headroom for other calls
+S3_MAX_POOL_CONNECTIONS = int(os.getenv('S3_MAX_POOL_CONNECTIONS', '50'))
+
+# Content types auto-detected from the file extension for common video/audio/image files
+_CONTENT_TYPES = {
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.wav': 'audio/wav',
+    '.mp3': 'audio/mpeg',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif'
+}
+
+# HEAD responses for existing objects are reused for this many seconds (0 disables)
+S3_HEAD_CACHE_TTL = float(os.getenv('S3_HEAD_CACHE_TTL', '300'))
+S3_HEAD_CACHE_MAXSIZE = 4096
+
+# A successful health_check is trusted for this many seconds before probing S3 again
+S3_HEALTH_CACHE_TTL = float(os.getenv('S3_HEALTH_CACHE_TTL', '30'))
+
+# Skip the startup head_bucket/create_bucket where the bucket is known to exist
+S3_SKIP_BUCKET_CHECK = os.getenv('S3_SKIP_BUCKET_CHECK', 'false').lower() in ('1', 'true')
+
+# (endpoint, bucket) pairs already checked by this process
+_checked_buckets = set()
+_bucket_check_lock = threading.Lock()
+
+# Error codes S3 (and S3-compatible stores such as LocalStack) use for a missing key or bucket
+_NOT_FOUND_CODES = frozenset(('404', 'NoSuchKey', 'NoSuchBucket', 'NotFound'))
+
+def _is_not_found(error: ClientError) -> bool:
+    """Whether a ClientError means the object or bucket doesn't exist, tolerating partial responses"""
+    response = error.response or {}
+    if response.get('Error', {}).get('Code') in _NOT_FOUND_CODES:
+        return True
+    return response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 404
+
+@lru_cache(maxsize=None)
+def _get_session(access_key: str, secret_key: str, region: str) -> boto3.session.Session:
+    """One boto3 session per credential set, shared by every client in the process"""
+    return boto3.session.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region
+    )
+
 class S3Client:
     def __init__(self):
         """Initialize S3 client with environment configuration"""
@@ -23,43 +95,76 @@ class S3Client:
         self.public_url = os.getenv('S3_PUBLIC_URL', 'http://localhost:4566')
         self.use_ssl = os.getenv('S3_USE_SSL', 'false').lower() == 'true'
         
+        # Public URLs are this prefix plus the key
+        if self.endpoint_url:  # LocalStack or custom endpoint
+            self._url_prefix = f"{self.public_url}/{self.bucket_name}/"
+        else:  # AWS S3
+            self._url_prefix = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/"
+        
+        # Presigned URLs address the endpoint the client talks to, not the public URL
+        if self.endpoint_url:
+            self._presign_prefix = f"{self.endpoint_url}/{self.bucket_name}/"
+        else:
+            self._presign_prefix = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/"
+        
+        # key -> (expiry, head_object response, complete); only existing objects are
+        # cached, and entries filled from a listing (see prefetch_prefix) are incomplete
+        self._head_cache: Dict[str, Tuple[float, dict, bool]] = {}
+        self._head_lock = threading.Lock()
+        
+        # Result of the last real health probe and when it last succeeded
+        self._healthy = False
+        self._last_healthy_at = float('-inf')
+        
         # Initialize boto3 client
         self._client = self._create_client()
-        self._ensure_bucket_exists()
+        self._credentials = _get_session(self.access_key, self.secret_key, self.region).get_credentials()
+        if not S3_SKIP_BUCKET_CHECK:
+            self._ensure_bucket_exists_once()
 
     def _create_client(self):
         """Create boto3 S3 client with proper configuration"""
         try:
-            config_kwargs = {
-                'aws_access_key_id': self.access_key,
-                'aws_secret_access_key': self.secret_key,
-                'region_name': self.region,
-            }
+            config_kwargs = {}
             
             if self.endpoint_url:
                 config_kwargs['endpoint_url'] = self.endpoint_url
                 # For LocalStack, disable SSL verification
                 config_kwargs['use_ssl'] = self.use_ssl
-                config_kwargs['config'] = boto3.session.Config(
-                    s3={'addressing_style': 'path'}
-                )
             
-            client = boto3.client('s3', **config_kwargs)
-            logger.info(f"S3 client initialized with endpoint: {self.endpoint_url or 'AWS S3'}")
+            config_kwargs['config'] = Config(
+                max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                retries={'max_attempts': 10, 'mode': 'adaptive'},
+                tcp_keepalive=True,
+                s3={'addressing_style': 'path'} if self.endpoint_url else {}
+            )
+            
+            session = _get_session(self.access_key, self.secret_key, self.region)
+            client = session.client('s3', **config_kwargs)
+            logger.info("S3 client initialized with endpoint: %s", self.endpoint_url or 'AWS S3')
             return client
             
         except Exception as e:
-            logger.error(f"Failed to create S3 client: {e}")
+            logger.error("Failed to create S3 client: %s", e)
             raise
 
+    def _ensure_bucket_exists_once(self):
+        """Run the bucket check once per process, however many clients are created"""
+        bucket = (self.endpoint_url, self.bucket_name)
+        # Held across the check so concurrent first callers wait rather than all creating the bucket
+        with _bucket_check_lock:
+            if bucket in _checked_buckets:
+                return
+            self._ensure_bucket_exists()
+            _checked_buckets.add(bucket)
+
     def _ensure_bucket_exists(self):
         """Ensure the S3 bucket exists, create if it doesn't"""
         try:
             self._client.head_bucket(Bucket=self.bucket_name)
-            logger.info(f"S3 bucket '{self.bucket_name}' exists")
+            logger.info("S3 bucket '%s' exists", self.bucket_name)
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == '404':
+            if _is_not_found(e):
                 try:
                     if self.region == 'us-east-1':
                         # us-east-1 doesn't need CreateBucketConfiguration
@@ -69,17 +174,89 @@ class S3Client:
                             Bucket=self.bucket_name,
                             CreateBucketConfiguration={'LocationConstraint': self.region}
                         )
-                    logger.info(f"Created S3 bucket '{self.bucket_name}'")
+                    logger.info("Created S3 bucket '%s'", self.bucket_name)
                 except ClientError as create_error:
-                    logger.error(f"Failed to create bucket: {create_error}")
+                    logger.error("Failed to create bucket: %s", create_error)
                     raise
-            elif error_code == '403':
+            elif (e.response or {}).get('ResponseMetadata', {}).get('HTTPStatusCode') == 403:
                 # Bucket exists but we don't have permission to check - that's OK for LocalStack startup
-                logger.warning(f"Cannot verify bucket exists (403), assuming it exists: {self.bucket_name}")
+                logger.warning("Cannot verify bucket exists (403), assuming it exists: %s", self.bucket_name)
             else:
-                logger.error(f"Error checking bucket: {e}")
+                logger.error("Error checking bucket: %s", e)
                 raise
 
+    def _head(self, s3_key: str, complete: bool = True) -> Optional[dict]:
+        """
+        HEAD an object, reusing a recent response for the same key
+        
+        Args:
+            s3_key: S3 key (path) of the object
+            complete: Whether the full HEAD response is needed; if not, an entry
+                from prefetch_prefix (size, date and ETag only) will do
+        
+        Returns:
+            The head_object response, or None if the object doesn't exist
+            (other client errors are raised)
+        """
+        now = time.monotonic()
+        with self._head_lock:
+            cached = self._head_cache.get(s3_key)
+            if cached is not None and cached[0] > now and (cached[2] or not complete):
+                return cached[1]
+        
+        try:
+            response = self._client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+        
+        self._cache_head(s3_key, response, True, now)
+        return response
+
+    def _cache_head(self, s3_key: str, response: dict, complete: bool, now: float):
+        if S3_HEAD_CACHE_TTL <= 0:
+            return
+        with self._head_lock:
+            if s3_key not in self._head_cache and len(self._head_cache) >= S3_HEAD_CACHE_MAXSIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._head_cache.pop(next(iter(self._head_cache)))
+            self._head_cache[s3_key] = (now + S3_HEAD_CACHE_TTL, response, complete)
+
+    def prefetch_prefix(self, prefix: str) -> int:
+        """
+        List every object under a prefix once so that file_exists calls for
+        those keys are answered from the HEAD cache instead of one HEAD each
+        
+        Args:
+            prefix: Prefix to list (e.g., "clips/<stream_id>/")
+            
+        Returns:
+            Number of objects found, or -1 if listing failed
+        """
+        if S3_HEAD_CACHE_TTL <= 0:
+            return 0
+        try:
+            count = 0
+            now = time.monotonic()
+            paginator = self._client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    self._cache_head(obj['Key'], {
+                        'ContentLength': obj.get('Size'),
+                        'LastModified': obj.get('LastModified'),
+                        'ETag': obj.get('ETag')
+                    }, False, now)
+                    count += 1
+            return count
+        except ClientError as e:
+            logger.error("Failed to prefetch objects with prefix %s: %s", prefix, e)
+            return -1
+
+    def _invalidate_head(self, s3_key: str):
+        with self._head_lock:
+            self._head_cache.pop(s3_key, None)
+
     def upload_file(self, local_path: str, s3_key: str, content_type: Optional[str] = None) -> Optional[str]:
         """
         Upload a file to S3
@@ -93,56 +270,37 @@ class S3Client:
             Public URL of the uploaded file, or None if upload failed
         """
         try:
-            if not os.path.exists(local_path):
-                logger.error(f"Local file does not exist: {local_path}")
-                return None
-            
-            extra_args = {}
-            if content_type:
-                extra_args['ContentType'] = content_type
-            
             # Auto-detect content type for common video/audio files
             if not content_type:
-                ext = os.path.splitext(local_path)[1].lower()
-                content_type_map = {
-                    '.mp4': 'video/mp4',
-                    '.webm': 'video/webm',
-                    '.avi': 'video/x-msvideo',
-                    '.mov': 'video/quicktime',
-                    '.wav': 'audio/wav',
-                    '.mp3': 'audio/mpeg',
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.png': 'image/png',
-                    '.gif': 'image/gif'
-                }
-                if ext in content_type_map:
-                    extra_args['ContentType'] = content_type_map[ext]
-            
-            # Upload the file
+                content_type = _CONTENT_TYPES.get(os.path.splitext(local_path)[1].lower())
+            extra_args = {'ContentType': content_type} if content_type else {}
+            
+            # Upload the file (a missing file raises FileNotFoundError, handled below)
+            self._invalidate_head(s3_key)
             self._client.upload_file(
                 Filename=local_path,
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=_TRANSFER_CONFIG
             )
             
             # Generate public URL
             public_url = self.get_public_url(s3_key)
-            logger.info(f"Successfully uploaded {local_path} to {public_url}")
+            logger.info("Successfully uploaded %s to %s", local_path, public_url)
             return public_url
             
         except FileNotFoundError:
-            logger.error(f"File not found: {local_path}")
+            logger.error("File not found: %s", local_path)
             return None
         except NoCredentialsError:
             logger.error("AWS credentials not found")
             return None
         except ClientError as e:
-            logger.error(f"Failed to upload {local_path} to S3: {e}")
+            logger.error("Failed to upload %s to S3: %s", local_path, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error uploading {local_path}: {e}")
+            logger.error("Unexpected error uploading %s: %s", local_path, e)
             return None
 
     def download_file(self, s3_key: str, local_path: str) -> bool:
@@ -158,24 +316,106 @@ class S3Client:
         """
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            local_dir = os.path.dirname(local_path)
+            if local_dir and not os.path.isdir(local_dir):
+                os.makedirs(local_dir, exist_ok=True)
             
+            # s3transfer writes to a temporary name and renames it into place on
+            # completion, so an interrupted download never leaves a partial local_path
             self._client.download_file(
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                Filename=local_path
+                Filename=local_path,
+                Config=_TRANSFER_CONFIG
             )
             
-            logger.info(f"Successfully downloaded {s3_key} to {local_path}")
+            logger.info("Successfully downloaded %s to %s", s3_key, local_path)
             return True
             
         except ClientError as e:
-            logger.error(f"Failed to download {s3_key} from S3: {e}")
+            logger.error("Failed to download %s from S3: %s", s3_key, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error downloading {s3_key}: {e}")
+            logger.error("Unexpected error downloading %s: %s", s3_key, e)
             return False
 
+    def upload_bytes(self, data: Union[bytes, BinaryIO], s3_key: str, content_type: Optional[str] = None) -> Optional[str]:
+        """
+        Upload in-memory data to S3 without writing it to a local file first
+        
+        Args:
+            data: Bytes, or a binary file-like object positioned at the start
+            s3_key: S3 key (path) for the object
+            content_type: MIME type of the data (detected from the key extension if omitted)
+            
+        Returns:
+            Public URL of the uploaded object, or None if upload failed
+        """
+        try:
+            fileobj = BytesIO(data) if isinstance(data, (bytes, bytearray, memoryview)) else data
+            
+            if not content_type:
+                content_type = _CONTENT_TYPES.get(os.path.splitext(s3_key)[1].lower())
+            extra_args = {'ContentType': content_type} if content_type else {}
+            
+            self._invalidate_head(s3_key)
+            self._client.upload_fileobj(
+                Fileobj=fileobj,
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                ExtraArgs=extra_args,
+                Config=_TRANSFER_CONFIG
+            )
+            
+            public_url = self.get_public_url(s3_key)
+            logger.info("Successfully uploaded in-memory data to %s", public_url)
+            return public_url
+            
+        except NoCredentialsError:
+            logger.error("AWS credentials not found")
+            return None
+        except ClientError as e:
+            logger.error("Failed to upload data to %s: %s", s3_key, e)
+            return None
+        except Exception as e:
+            logger.error("Unexpected error uploading data to %s: %s", s3_key, e)
+            return None
+
+    def upload_files(self, pairs: List[Tuple[str, str]], max_workers: int = 16) -> List[Optional[str]]:
+        """
+        Upload several files to S3 concurrently
+        
+        Args:
+            pairs: (local_path, s3_key) for each file
+            max_workers: Maximum uploads in flight at once
+            
+        Returns:
+            Public URL (or None on failure) for each pair, in order
+        """
+        if not pairs:
+            return []
+        # The client is thread-safe; keep within its connection pool
+        workers = min(max_workers, len(pairs), S3_MAX_POOL_CONNECTIONS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda pair: self.upload_file(*pair), pairs))
+
+    def download_files(self, pairs: List[Tuple[str, str]], max_workers: int = 16) -> List[bool]:
+        """
+        Download several files from S3 concurrently
+        
+        Args:
+            pairs: (s3_key, local_path) for each file
+            max_workers: Maximum downloads in flight at once
+            
+        Returns:
+            Whether each download succeeded, in order
+        """
+        if not pairs:
+            return []
+        workers = min(max_workers, len(pairs), S3_MAX_POOL_CONNECTIONS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda pair: self.download_file(*pair), pairs))
+
     def delete_file(self, s3_key: str) -> bool:
         """
         Delete a file from S3
@@ -187,17 +427,55 @@ class S3Client:
             True if deletion successful, False otherwise
         """
         try:
+            self._invalidate_head(s3_key)
             self._client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            logger.info(f"Successfully deleted {s3_key} from S3")
+            logger.info("Successfully deleted %s from S3", s3_key)
             return True
             
         except ClientError as e:
-            logger.error(f"Failed to delete {s3_key} from S3: {e}")
+            logger.error("Failed to delete %s from S3: %s", s3_key, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error deleting {s3_key}: {e}")
+            logger.error("Unexpected error deleting %s: %s", s3_key, e)
             return False
 
+    def delete_files(self, s3_keys: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Delete several files from S3, up to 1000 per DeleteObjects request
+        
+        Args:
+            s3_keys: S3 keys (paths) of the files to delete
+            
+        Returns:
+            (deleted keys, keys that failed to delete)
+        """
+        deleted: List[str] = []
+        failed: List[str] = []
+        for start in range(0, len(s3_keys), 1000):
+            batch = s3_keys[start:start + 1000]
+            for s3_key in batch:
+                self._invalidate_head(s3_key)
+            try:
+                # Quiet mode only reports the keys that could not be deleted
+                response = self._client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': k} for k in batch], 'Quiet': True}
+                )
+            except Exception as e:
+                logger.error("Failed to delete %s files from S3: %s", len(batch), e)
+                failed.extend(batch)
+                continue
+            
+            errors = {err['Key']: err.get('Message') for err in response.get('Errors', [])}
+            for s3_key, message in errors.items():
+                logger.error("Failed to delete %s from S3: %s", s3_key, message)
+            failed.extend(k for k in batch if k in errors)
+            deleted.extend(k for k in batch if k not in errors)
+        
+        if deleted:
+            logger.info("Successfully deleted %s files from S3", len(deleted))
+        return deleted, failed
+
     def file_exists(self, s3_key: str) -> bool:
         """
         Check if a file exists in S3
@@ -209,12 +487,9 @@ class S3Client:
             True if file exists, False otherwise
         """
         try:
-            self._client.head_object(Bucket=self.bucket_name, Key=s3_key)
-            return True
+            return self._head(s3_key, complete=False) is not None
         except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return False
-            logger.error(f"Error checking if {s3_key} exists: {e}")
+            logger.error("Error checking if %s exists: %s", s3_key, e)
             return False
 
     def get_public_url(self, s3_key: str) -> str:
@@ -227,10 +502,7 @@ class S3Client:
         Returns:
             Public URL to access the file
         """
-        if self.endpoint_url:  # LocalStack or custom endpoint
-            return f"{self.public_url}/{self.bucket_name}/{s3_key}"
-        else:  # AWS S3
-            return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
+        return self._url_prefix + s3_key
 
     def get_presigned_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
         """
@@ -243,6 +515,18 @@ class S3Client:
         Returns:
             Presigned URL or None if generation failed
         """
+        if self._credentials is not None:
+            try:
+                # Sign the GET directly with SigV4 query auth; generate_presigned_url
+                # goes through botocore's request model and event hooks on every call
+                request = AWSRequest(method='GET', url=self._presign_prefix + quote(s3_key, safe='/~'))
+                S3SigV4QueryAuth(
+                    self._credentials.get_frozen_credentials(), 's3', self.region, expires=expiration
+                ).add_auth(request)
+                return request.url
+            except Exception as e:
+                logger.warning("Falling back to botocore presigning for %s: %s", s3_key, e)
+        
         try:
             url = self._client.generate_presigned_url(
                 'get_object',
@@ -251,35 +535,41 @@ class S3Client:
             )
             return url
         except ClientError as e:
-            logger.error(f"Failed to generate presigned URL for {s3_key}: {e}")
+            logger.error("Failed to generate presigned URL for %s: %s", s3_key, e)
             return None
 
-    def list_files(self, prefix: str = "", max_keys: int = 1000) -> list:
+    def list_files(self, prefix: str = "", max_keys: Optional[int] = None) -> Iterator[str]:
         """
         List files in S3 bucket with optional prefix filter
         
+        Keys are fetched a page (up to 1000) at a time as the caller iterates,
+        so large prefixes are never held in memory all at once.
+        
         Args:
             prefix: Prefix to filter files (e.g., "streams/", "clips/")
-            max_keys: Maximum number of files to return
+            max_keys: Maximum number of files to return (None for all of them)
             
         Returns:
-            List of S3 object keys
+            Iterator over S3 object keys
+            
+        Raises:
+            ClientError: If a page can't be listed; keys already yielded stand, so a
+                failure part-way through isn't mistaken for the end of the listing
         """
         try:
-            response = self._client.list_objects_v2(
+            paginator = self._client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
                 Bucket=self.bucket_name,
                 Prefix=prefix,
-                MaxKeys=max_keys
+                PaginationConfig={'PageSize': 1000, 'MaxItems': max_keys}
             )
-            
-            if 'Contents' not in response:
-                return []
-            
-            return [obj['Key'] for obj in response['Contents']]
+            for page in pages:
+                for obj in page.get('Contents', []):
+                    yield obj['Key']
             
         except ClientError as e:
-            logger.error(f"Failed to list files with prefix {prefix}: {e}")
-            return []
+            logger.error("Failed to list files with prefix %s: %s", prefix, e)
+            raise
 
     def get_file_info(self, s3_key: str) -> Optional[dict]:
         """
@@ -292,7 +582,9 @@ class S3Client:
             Dict with file metadata or None if file doesn't exist
         """
         try:
-            response = self._client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            response = self._head(s3_key)
+            if response is None:
+                return None
             return {
                 'size': response.get('ContentLength'),
                 'last_modified': response.get('LastModified'),
@@ -301,35 +593,134 @@ class S3Client:
                 'metadata': response.get('Metadata', {})
             }
         except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return None
-            logger.error(f"Failed to get file info for {s3_key}: {e}")
+            logger.error("Failed to get file info for %s: %s", s3_key, e)
             return None
 
-    def health_check(self) -> bool:
+    def verify_etag(self, local_path: str, s3_key: str,
+                    part_size: int = _TRANSFER_CONFIG.multipart_chunksize) -> bool:
+        """
+        Check a local file against the ETag of an S3 object without downloading it
+        
+        Args:
+            local_path: Local file to check
+            s3_key: S3 key (path) of the object
+            part_size: Part size the object was uploaded with, if multipart
+                (defaults to the part size upload_file uses)
+            
+        Returns:
+            True if the local file matches the object, False otherwise
+        """
+        try:
+            response = self._head(s3_key, complete=False)
+            if response is None or not response.get('ETag'):
+                return False
+            
+            etag = response['ETag'].strip('"')
+            expected, _, parts = etag.partition('-')
+            
+            with open(local_path, 'rb') as f:
+                if not parts:
+                    # Single-part upload: the ETag is the MD5 of the whole object
+                    digest = hashlib.md5()
+                    for chunk in iter(lambda: f.read(8 * MB), b''):
+                        digest.update(chunk)
+                    return digest.hexdigest() == expected
+                
+                # Multipart upload: the ETag is the MD5 of the concatenated part MD5s, plus the part count
+                part_digests = [hashlib.md5(chunk).digest() for chunk in iter(lambda: f.read(part_size), b'')]
+                return (str(len(part_digests)) == parts
+                        and hashlib.md5(b''.join(part_digests)).hexdigest() == expected)
+            
+        except ClientError as e:
+            logger.error("Failed to verify %s against %s: %s", local_path, s3_key, e)
+            return False
+        except OSError as e:
+            logger.error("Failed to read %s: %s", local_path, e)
+            return False
+
+    def health_check(self, mode: str = "readiness") -> bool:
         """
         Check if S3 service is accessible
         
+        Args:
+            mode: "readiness" probes S3 unless it succeeded within S3_HEALTH_CACHE_TTL;
+                "liveness" only reports the last probe's result (False before the first),
+                without any request
+        
         Returns:
             True if S3 is accessible, False otherwise
         """
+        if mode == "liveness":
+            return self._healthy
+        if time.monotonic() - self._last_healthy_at < S3_HEALTH_CACHE_TTL:
+            return True
+        
         try:
             self._client.head_bucket(Bucket=self.bucket_name)
-            return True
-        except ClientError:
-            return False
+            self._healthy = True
+            self._last_healthy_at = time.monotonic()
         except Exception:
-            return False
+            self._healthy = False
+        return self._healthy
+
+
+class AsyncS3Client:
+    """
+    Awaitable facade over S3Client for asyncio services
+    
+    boto3 calls block, so each one runs on a worker thread; a semaphore caps
+    how many are in flight so the connection pool and thread count stay bounded.
+    """
+    
+    def __init__(self, client: Optional[S3Client] = None, max_concurrency: int = S3_MAX_CONCURRENCY):
+        self._client = client or get_s3_client()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _run(self, func, *args):
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args)
+    
+    async def upload_file(self, local_path: str, s3_key: str, content_type: Optional[str] = None) -> Optional[str]:
+        """Upload a file to S3 and return its public URL"""
+        return await self._run(self._client.upload_file, local_path, s3_key, content_type)
+    
+    async def upload_bytes(self, data: Union[bytes, BinaryIO], s3_key: str, content_type: Optional[str] = None) -> Optional[str]:
+        """Upload in-memory data to S3 and return its public URL"""
+        return await self._run(self._client.upload_bytes, data, s3_key, content_type)
+    
+    async def download_file(self, s3_key: str, local_path: str) -> bool:
+        """Download a file from S3"""
+        return await self._run(self._client.download_file, s3_key, local_path)
+    
+    async def delete_file(self, s3_key: str) -> bool:
+        """Delete a file from S3"""
+        return await self._run(self._client.delete_file, s3_key)
+    
+    async def delete_files(self, s3_keys: List[str]) -> Tuple[List[str], List[str]]:
+        """Delete several files from S3 in batches"""
+        return await self._run(self._client.delete_files, s3_keys)
+    
+    async def file_exists(self, s3_key: str) -> bool:
+        """Check if a file exists in S3"""
+        return await self._run(self._client.file_exists, s3_key)
+    
+    async def get_presigned_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
+        """Generate a presigned GET URL"""
+        return await self._run(self._client.get_presigned_url, s3_key, expiration)
 
 
 # Global S3 client instance
 _s3_client = None
+_s3_client_lock = threading.Lock()
 
 def get_s3_client() -> S3Client:
     """Get or create global S3 client instance"""
     global _s3_client
     if _s3_client is None:
-        _s3_client = S3Client()
+        with _s3_client_lock:
+            # Another thread may have created it while we waited
+            if _s3_client is None:
+                _s3_client = S3Client()
     return _s3_client
 
 